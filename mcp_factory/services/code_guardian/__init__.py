@@ -21,6 +21,7 @@ from mcp_factory.services.code_guardian.analyzers.dependencies import Dependency
 from mcp_factory.services.code_guardian.analyzers.secrets import SecretAnalyzer
 from mcp_factory.services.code_guardian.analyzers.security_patterns import SecurityPatternAnalyzer
 from mcp_factory.services.code_guardian.analyzers.style import StyleAnalyzer
+from mcp_factory.services.code_guardian.cache import ScanCache
 from mcp_factory.services.code_guardian.config import (
     OSV_API_BASE_URL,
     OSV_API_KEY,
@@ -56,7 +57,7 @@ class CodeGuardianService:
         self._registry.add(SecurityPatternAnalyzer())
         self._registry.add(DebugStatementAnalyzer())
         self._registry.add(CodeQualityAnalyzer())
-        self._registry.add(StyleAnalyzer())
+        self._registry.add(StyleAnalyzer(cache=ScanCache()))
         self._registry.add(DependencyAnalyzer(self._osv_client))
 
     def register(self, mcp: FastMCP) -> None:
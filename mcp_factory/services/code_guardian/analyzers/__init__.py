@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from typing import Any
 
 from mcp_factory.services.code_guardian.models import Finding, ScanResult, ScannedFile
 
@@ -17,6 +19,52 @@ logger = logging.getLogger(__name__)
 __all__ = ["BaseAnalyzer", "AnalyzerRegistry"]
 
 
+def _source_lines(content: str) -> list[str]:
+    """Split file content into the lines every analyzer numbers.
+
+    Lines break only at ``"\\n"``, and the ``"\\r"`` of a CRLF ending is
+    dropped.  This matches :mod:`ast` line numbers and whole-file
+    searches that count newlines.  :meth:`str.splitlines` would also
+    break on form feeds, ``\\x1c``-``\\x1e``, ``\\x85`` and ``\\u2028``,
+    so analyzers using it would disagree on line numbers.
+
+    Args:
+        content: Full text of a scanned file.
+
+    Returns:
+        The file's lines, numbered from 1 by position.
+    """
+    lines = content.split("\n")
+    if "\r" in content:
+        lines = [line.removesuffix("\r") for line in lines]
+    return lines
+
+
+def _rules_with_hints[R: tuple[Any, ...]](
+    content: str, rules: Iterable[R], hints: Mapping[str, tuple[str, ...]]
+) -> list[R]:
+    """Keep the rules whose hint substrings occur in *content*.
+
+    A substring search over the whole file is far cheaper than a regex
+    search per line, so rules whose literals never appear are dropped
+    before any line is visited.  Hints are case-folded, and those for
+    case-insensitive rules avoid ``i``: ``re`` folds ``ı`` and ``İ`` to
+    it but :meth:`str.casefold` does not, so such a hint could skip a
+    file the pattern would match.
+
+    Args:
+        content: Full text of a scanned file.
+        rules: Rule tuples whose first item is the rule id.
+        hints: Case-folded substrings per rule id, one of which must
+               occur for the rule to match.
+
+    Returns:
+        The rules that may match, in their original order.
+    """
+    folded = content.casefold()
+    return [rule for rule in rules if any(hint in folded for hint in hints[rule[0]])]
+
+
 class BaseAnalyzer(ABC):
     """Contract for all Code Guardian analyzers.
 
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import re
 
-from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer
+from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer, _source_lines
 from mcp_factory.services.code_guardian.config import (
     FILE_SIZE_ERROR_LINES,
     FILE_SIZE_WARN_LINES,
@@ -137,7 +137,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
             One finding per offending line.
         """
         findings: list[Finding] = []
-        for line_num, line in enumerate(scanned.content.splitlines(), start=1):
+        for line_num, line in enumerate(_source_lines(scanned.content), start=1):
             if len(line) > LINE_LENGTH_LIMIT:
                 findings.append(
                     Finding(
@@ -167,7 +167,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
         findings: list[Finding] = []
 
         if scanned.language in _INDENT_LANGUAGES:
-            for line_num, line in enumerate(scanned.content.splitlines(), start=1):
+            for line_num, line in enumerate(_source_lines(scanned.content), start=1):
                 if not line.strip():
                     continue
                 spaces = len(line) - len(line.lstrip())
@@ -186,7 +186,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                     )
         else:
             depth = 0
-            for line_num, line in enumerate(scanned.content.splitlines(), start=1):
+            for line_num, line in enumerate(_source_lines(scanned.content), start=1):
                 depth += len(_NESTING_OPENERS.findall(line))
                 depth -= len(_NESTING_CLOSERS.findall(line))
                 depth = max(depth, 0)
@@ -217,7 +217,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
         """
         findings: list[Finding] = []
 
-        for line_num, line in enumerate(scanned.content.splitlines(), start=1):
+        for line_num, line in enumerate(_source_lines(scanned.content), start=1):
             for pattern, languages in _FUNCTION_SIGNATURES:
                 if scanned.language not in languages:
                     continue
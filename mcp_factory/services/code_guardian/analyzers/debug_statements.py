@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import re
 
-from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer
+from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer, _source_lines
 from mcp_factory.services.code_guardian.models import Finding, ScannedFile
 
 _DEBUG_PATTERNS: list[tuple[re.Pattern[str], str, set[str]]] = [
@@ -103,7 +103,7 @@ class DebugStatementAnalyzer(BaseAnalyzer):
         findings: list[Finding] = []
 
         for scanned in files:
-            lines = scanned.content.splitlines()
+            lines = _source_lines(scanned.content)
             for line_num, line in enumerate(lines, start=1):
                 stripped = line.strip()
                 if not stripped or stripped.startswith(("#", "//", "/*", "*")):
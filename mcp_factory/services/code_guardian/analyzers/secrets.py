@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import re
 
-from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer
+from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer, _rules_with_hints, _source_lines
 from mcp_factory.services.code_guardian.models import Finding, ScannedFile
 
 _SECRET_PATTERNS: list[tuple[str, re.Pattern[str], str]] = [
@@ -79,6 +79,23 @@ _SECRET_PATTERNS: list[tuple[str, re.Pattern[str], str]] = [
 ]
 """Compiled (rule-id, pattern, message) tuples for secret detection."""
 
+_RULE_HINTS: dict[str, tuple[str, ...]] = {
+    "aws-access-key": ("akia",),
+    "aws-secret-key": ("secret_key", "secret_access_key"),
+    "github-token": ("ghp_", "gho_", "ghu_", "ghs_", "ghr_"),
+    "generic-api-key": ("key", "secret", "token"),
+    "generic-secret": ("secret", "passw", "pwd", "token"),
+    "private-key": ("private key-----",),
+    "jwt-token": ("eyj",),
+    "connection-string": ("://",),
+    "gcp-api-key": ("aiza",),
+    "slack-token": ("xox",),
+}
+"""Per-rule hints for :func:`_rules_with_hints`."""
+
+_CRITICAL_RULES: frozenset[str] = frozenset({"aws-access-key", "aws-secret-key", "private-key"})
+"""Rule ids reported as ``critical``; every other secret is ``high``."""
+
 
 class SecretAnalyzer(BaseAnalyzer):
     """Detects exposed secrets, credentials, and tokens in source files.
@@ -110,9 +127,12 @@ class SecretAnalyzer(BaseAnalyzer):
         findings: list[Finding] = []
 
         for scanned in files:
-            lines = scanned.content.splitlines()
+            patterns = _rules_with_hints(scanned.content, _SECRET_PATTERNS, _RULE_HINTS)
+            if not patterns:
+                continue
+            lines = _source_lines(scanned.content)
             for line_num, line in enumerate(lines, start=1):
-                for rule_id, pattern, message in _SECRET_PATTERNS:
+                for rule_id, pattern, message in patterns:
                     if pattern.search(line):
                         severity = self._severity_for_rule(rule_id)
                         findings.append(
@@ -140,5 +160,4 @@ class SecretAnalyzer(BaseAnalyzer):
             ``"critical"`` for private keys and known provider keys,
             ``"high"`` for everything else.
         """
-        critical_rules = {"aws-access-key", "aws-secret-key", "private-key"}
-        return "critical" if rule_id in critical_rules else "high"
+        return "critical" if rule_id in _CRITICAL_RULES else "high"
@@ -8,9 +8,10 @@ deserialization.
 
 from __future__ import annotations
 
+import functools
 import re
 
-from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer
+from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer, _rules_with_hints, _source_lines
 from mcp_factory.services.code_guardian.models import Finding, ScannedFile
 
 _SECURITY_PATTERNS: list[tuple[str, str, re.Pattern[str], str, set[str]]] = [
@@ -124,6 +125,43 @@ _SECURITY_PATTERNS: list[tuple[str, str, re.Pattern[str], str, set[str]]] = [
 ]
 """(rule_id, severity, pattern, message, applicable_languages) tuples."""
 
+_RULE_HINTS: dict[str, tuple[str, ...]] = {
+    "sql-injection": ("exec", "query"),
+    "sql-injection-fstring": ("select", "nsert", "update", "delete", "drop"),
+    "xss-innerhtml": ("innerhtml",),
+    "xss-dangerously-set": ("dangerouslysetinnerhtml",),
+    "xss-document-write": ("document.write",),
+    "eval-usage": ("eval",),
+    "insecure-hash-md5": ("md5",),
+    "insecure-hash-sha1": ("sha1",),
+    "path-traversal": ("../",),
+    "insecure-deserialization": ("pickle.load", "yaml.load", "marshal.load"),
+    "insecure-random": ("math.random",),
+    "hardcoded-ip": (".",),
+    "subprocess-shell-true": ("shell",),
+    "exec-usage": ("exec",),
+}
+"""Per-rule hints for :func:`_rules_with_hints`; ``"nsert"`` stands in
+for ``"insert"`` because the SQL rule is case-insensitive."""
+
+
+@functools.cache
+def _patterns_for(language: str) -> tuple[tuple[str, str, re.Pattern[str], str], ...]:
+    """Return the security patterns that apply to *language*.
+
+    Args:
+        language: Detected language of a scanned file.
+
+    Returns:
+        (rule-id, severity, pattern, message) tuples, computed once per
+        language.
+    """
+    return tuple(
+        (rule_id, severity, pattern, message)
+        for rule_id, severity, pattern, message, languages in _SECURITY_PATTERNS
+        if language in languages
+    )
+
 
 class SecurityPatternAnalyzer(BaseAnalyzer):
     """Detects OWASP-inspired security antipatterns in source code.
@@ -154,14 +192,15 @@ class SecurityPatternAnalyzer(BaseAnalyzer):
         findings: list[Finding] = []
 
         for scanned in files:
-            lines = scanned.content.splitlines()
+            patterns = _rules_with_hints(scanned.content, _patterns_for(scanned.language), _RULE_HINTS)
+            if not patterns:
+                continue
+            lines = _source_lines(scanned.content)
             for line_num, line in enumerate(lines, start=1):
                 stripped = line.strip()
                 if not stripped:
                     continue
-                for rule_id, severity, pattern, message, languages in _SECURITY_PATTERNS:
-                    if scanned.language not in languages:
-                        continue
+                for rule_id, severity, pattern, message in patterns:
                     if pattern.search(line):
                         findings.append(
                             Finding(
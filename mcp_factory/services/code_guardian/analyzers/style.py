@@ -8,37 +8,132 @@ convention hints.
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import heapq
 import re
+import threading
+import warnings
+from collections.abc import Iterable, Iterator
 
-from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer
+from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer, _source_lines
+from mcp_factory.services.code_guardian.cache import ScanCache
 from mcp_factory.services.code_guardian.models import Finding, ScannedFile
 
 _TODO_PATTERN = re.compile(r"(?i)\b(?:TODO|FIXME|HACK|XXX|TEMP)\b")
-_TRAILING_WHITESPACE = re.compile(r"[ \t]+$")
 _MIXED_INDENT = re.compile(r"^( +\t|\t+ )")
 
-_PEP8_SNAKE_FUNC = re.compile(r"def\s+([a-z][a-zA-Z]+[A-Z][a-zA-Z]*)\s*\(")
-_PEP8_CLASS_NAME = re.compile(r"class\s+([a-z_][a-z_0-9]*)\s*[\(:]")
+_PEP8_SNAKE_FUNC = re.compile(r"def[^\S\n]+([a-z][a-zA-Z]+[A-Z][a-zA-Z]*)[^\S\n]*\(")
+_PEP8_CLASS_NAME = re.compile(r"class[^\S\n]+([a-z_][a-z_0-9]*)[^\S\n]*[\(:]")
 _PEP8_CONSTANT_LOWER = re.compile(
     r"^([A-Z][A-Z_0-9]*)\s*=\s*"
 )
 
-_JS_SNAKE_FUNC = re.compile(
-    r"(?:function\s+|(?:const|let|var)\s+)"
-    r"([a-z]+_[a-z_]+)\s*(?:=\s*(?:async\s+)?(?:function|\()|\()"
+_JS_SNAKE_FUNCS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(
+        keyword + r"[^\S\n]+"
+        r"([a-z]+_[a-z_]+)[^\S\n]*(?:=[^\S\n]*(?:async[^\S\n]+)?(?:function|\()|\()"
+    )
+    for keyword in ("function", "const", "let", "var")
 )
+"""Naming patterns are searched over whole files, so their whitespace
+classes exclude newlines to keep each match on one line.  The JS check
+uses one pattern per keyword: a pattern that starts with a literal lets
+``re`` jump between occurrences of it, which a leading alternation does
+not."""
 
-_SUPERFLUOUS_COMMENT_PATTERNS: list[tuple[re.Pattern[str], set[str]]] = [
+_SUPERFLUOUS_COMMENT_PATTERNS: list[tuple[str, re.Pattern[str], set[str]]] = [
     (
+        "#",
         re.compile(r"^\s*#\s*(?:import|define|set|get|return|increment|decrement|initialize|init)\s", re.IGNORECASE),
         {"python"},
     ),
     (
+        "//",
         re.compile(r"^\s*//\s*(?:import|define|set|get|return|increment|decrement|initialize|init)\s", re.IGNORECASE),
         {"javascript", "typescript", "java", "go", "rust", "csharp", "c", "cpp"},
     ),
 ]
-"""Patterns matching comments that simply narrate what the next line does."""
+"""(comment-token, pattern, languages) tuples matching comments that simply
+narrate what the next line does.  Lines not starting with the token are
+rejected with :meth:`str.startswith` before the pattern runs."""
+
+
+def _first_match_per_line(
+    matches: Iterable[re.Match[str]], content: str
+) -> Iterator[tuple[int, str, re.Match[str]]]:
+    """Yield the first of *matches* on each line of *content*.
+
+    Line numbers are carried forward by counting newlines between
+    consecutive matches, so files with few matches are never split.
+
+    Args:
+        matches: Matches over *content* in order of position, none of
+                 which spans a newline.
+        content: Full text of a scanned file.
+
+    Yields:
+        (line-number, line, match) tuples in file order.
+    """
+    line_num = 1
+    position = 0
+    last_line = 0
+    for match in matches:
+        start = match.start()
+        line_num += content.count("\n", position, start)
+        position = start
+        if line_num == last_line:
+            continue
+        last_line = line_num
+        line_start = content.rfind("\n", 0, start) + 1
+        line_end = content.find("\n", start)
+        if line_end == -1:
+            line_end = len(content)
+        yield line_num, content[line_start:line_end], match
+
+
+_STATEMENT_FIELDS: tuple[str, ...] = ("body", "orelse", "finalbody", "handlers", "cases")
+"""AST fields holding nested statements.
+
+Definitions are statements, so walking only these fields finds them all
+while skipping expression subtrees, which make up most of the tree.
+"""
+
+
+_AST_WARNINGS_LOCK = threading.Lock()
+"""Held while parsing with SyntaxWarning silenced: ``warnings.catch_warnings``
+swaps process-wide filter state and scans run in worker threads."""
+
+
+def _python_definitions(content: str) -> set[tuple[int, str, str]] | None:
+    """Collect every function and class definition in Python source.
+
+    Args:
+        content: Full text of a Python file.
+
+    Returns:
+        (line-number, name, ``"function"`` or ``"class"``) tuples, or
+        ``None`` if the source does not parse or is too deeply nested
+        for the parser.
+    """
+    try:
+        with _AST_WARNINGS_LOCK, warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            tree = ast.parse(content)
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+    definitions: set[tuple[int, str, str]] = set()
+    stack: list[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        for field in _STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    definitions.add((child.lineno, child.name, "function"))
+                elif isinstance(child, ast.ClassDef):
+                    definitions.add((child.lineno, child.name, "class"))
+                stack.append(child)
+    return definitions
 
 
 class StyleAnalyzer(BaseAnalyzer):
@@ -47,8 +142,15 @@ class StyleAnalyzer(BaseAnalyzer):
     Checks trailing whitespace, TODO/FIXME markers, mixed indentation,
     PEP 8 naming for Python, camelCase conventions for JS/TS, and
     comments that just narrate code.
+
+    Args:
+        cache: Optional :class:`ScanCache`; files whose content was
+               already analyzed are answered from it.
     """
 
+    def __init__(self, cache: ScanCache | None = None) -> None:
+        self._cache = cache
+
     @property
     def name(self) -> str:
         """Returns ``"style-analyzer"``."""
@@ -62,41 +164,77 @@ class StyleAnalyzer(BaseAnalyzer):
     async def analyze(self, files: list[ScannedFile]) -> list[Finding]:
         """Run style checks on every file.
 
+        The checks are CPU-bound, so the whole batch runs in a worker
+        thread and the event loop stays free to serve other requests.
+
         Args:
             files: Pre-scanned source files.
 
         Returns:
             Aggregated style findings.
         """
-        findings: list[Finding] = []
+        return await asyncio.to_thread(self._scan_files, files)
+
+    def _scan_files(self, files: list[ScannedFile]) -> list[Finding]:
+        """Run every style check on *files*, in order.
+
+        Args:
+            files: Pre-scanned source files.
 
+        Returns:
+            Aggregated style findings.
+        """
+        findings: list[Finding] = []
         for scanned in files:
-            findings.extend(self._check_trailing_whitespace(scanned))
-            findings.extend(self._check_todo_comments(scanned))
-            findings.extend(self._check_mixed_indentation(scanned))
-            findings.extend(self._check_superfluous_comments(scanned))
+            if self._cache is None:
+                findings.extend(self._scan_file(scanned))
+                continue
+            key = ScanCache.key_for(scanned)
+            file_findings = self._cache.get(key)
+            if file_findings is None:
+                file_findings = self._scan_file(scanned)
+                self._cache.put(key, file_findings)
+            findings.extend(file_findings)
+        return findings
+
+    def _scan_file(self, scanned: ScannedFile) -> list[Finding]:
+        """Run every style check on one file.
+
+        Args:
+            scanned: The file to check.
 
-            if scanned.language == "python":
-                findings.extend(self._check_pep8_naming(scanned))
+        Returns:
+            The file's style findings.
+        """
+        findings: list[Finding] = []
+        lines = _source_lines(scanned.content)
+        findings.extend(self._check_trailing_whitespace(scanned, lines))
+        findings.extend(self._check_todo_comments(scanned, lines))
+        findings.extend(self._check_mixed_indentation(scanned, lines))
+        findings.extend(self._check_superfluous_comments(scanned, lines))
+
+        if scanned.language == "python":
+            findings.extend(self._check_pep8_naming(scanned))
 
-            if scanned.language in {"javascript", "typescript"}:
-                findings.extend(self._check_js_naming(scanned))
+        if scanned.language in {"javascript", "typescript"}:
+            findings.extend(self._check_js_naming(scanned))
 
         return findings
 
     @staticmethod
-    def _check_trailing_whitespace(scanned: ScannedFile) -> list[Finding]:
+    def _check_trailing_whitespace(scanned: ScannedFile, lines: list[str]) -> list[Finding]:
         """Detect trailing whitespace on non-empty lines.
 
         Args:
             scanned: The file to check.
+            lines: ``scanned.content`` split by :func:`_source_lines`.
 
         Returns:
             One finding per offending line.
         """
         findings: list[Finding] = []
-        for line_num, line in enumerate(scanned.content.splitlines(), start=1):
-            if _TRAILING_WHITESPACE.search(line) and line.strip():
+        for line_num, line in enumerate(lines, start=1):
+            if line and line[-1] in " \t" and line.strip():
                 findings.append(
                     Finding(
                         severity="info",
@@ -110,17 +248,24 @@ class StyleAnalyzer(BaseAnalyzer):
         return findings
 
     @staticmethod
-    def _check_todo_comments(scanned: ScannedFile) -> list[Finding]:
+    def _check_todo_comments(scanned: ScannedFile, lines: list[str]) -> list[Finding]:
         """Flag TODO, FIXME, HACK, XXX, and TEMP markers.
 
         Args:
             scanned: The file to check.
+            lines: ``scanned.content`` split by :func:`_source_lines`.
 
         Returns:
             One finding per marker.
         """
         findings: list[Finding] = []
-        for line_num, line in enumerate(scanned.content.splitlines(), start=1):
+        for line_num, line in enumerate(lines, start=1):
+            # Every marker contains one of these substrings, and the test is
+            # several times cheaper than the regex.  "xme" stands in for
+            # "fixme" for the reason given on _rules_with_hints.
+            folded = line.casefold()
+            if not ("todo" in folded or "xme" in folded or "hack" in folded or "xxx" in folded or "temp" in folded):
+                continue
             if _TODO_PATTERN.search(line):
                 findings.append(
                     Finding(
@@ -136,17 +281,23 @@ class StyleAnalyzer(BaseAnalyzer):
         return findings
 
     @staticmethod
-    def _check_mixed_indentation(scanned: ScannedFile) -> list[Finding]:
+    def _check_mixed_indentation(scanned: ScannedFile, lines: list[str]) -> list[Finding]:
         """Detect lines mixing tabs and spaces in indentation.
 
+        Most files contain no tab at all, so a single substring test
+        over the whole file settles them without visiting any line.
+
         Args:
             scanned: The file to check.
+            lines: ``scanned.content`` split by :func:`_source_lines`.
 
         Returns:
             One finding per offending line.
         """
         findings: list[Finding] = []
-        for line_num, line in enumerate(scanned.content.splitlines(), start=1):
+        if "\t" not in scanned.content:
+            return findings
+        for line_num, line in enumerate(lines, start=1):
             if _MIXED_INDENT.match(line):
                 findings.append(
                     Finding(
@@ -161,21 +312,28 @@ class StyleAnalyzer(BaseAnalyzer):
         return findings
 
     @staticmethod
-    def _check_superfluous_comments(scanned: ScannedFile) -> list[Finding]:
+    def _check_superfluous_comments(scanned: ScannedFile, lines: list[str]) -> list[Finding]:
         """Flag comments that simply narrate the code.
 
         Args:
             scanned: The file to check.
+            lines: ``scanned.content`` split by :func:`_source_lines`.
 
         Returns:
             One finding per superfluous comment.
         """
         findings: list[Finding] = []
-        for line_num, line in enumerate(scanned.content.splitlines(), start=1):
-            for pattern, languages in _SUPERFLUOUS_COMMENT_PATTERNS:
-                if scanned.language not in languages:
-                    continue
-                if pattern.match(line):
+        patterns = [
+            (token, pattern)
+            for token, pattern, languages in _SUPERFLUOUS_COMMENT_PATTERNS
+            if scanned.language in languages
+        ]
+        if not patterns:
+            return findings
+        for line_num, line in enumerate(lines, start=1):
+            stripped = line.lstrip()
+            for token, pattern in patterns:
+                if stripped.startswith(token) and pattern.match(line):
                     findings.append(
                         Finding(
                             severity="info",
@@ -194,6 +352,9 @@ class StyleAnalyzer(BaseAnalyzer):
         """Check Python naming conventions (PEP 8).
 
         Flags camelCase function names and lowercase class names.
+        Regex hits are confirmed against the parsed AST so that
+        ``def``/``class`` text inside strings and comments is ignored;
+        files that do not parse keep every regex hit.
 
         Args:
             scanned: The file to check.
@@ -201,35 +362,42 @@ class StyleAnalyzer(BaseAnalyzer):
         Returns:
             Findings for naming violations.
         """
+        candidates = [
+            (line_num, line, match.group(1), "function")
+            for line_num, line, match in _first_match_per_line(
+                _PEP8_SNAKE_FUNC.finditer(scanned.content), scanned.content
+            )
+        ]
+        candidates.extend(
+            (line_num, line, match.group(1), "class")
+            for line_num, line, match in _first_match_per_line(
+                _PEP8_CLASS_NAME.finditer(scanned.content), scanned.content
+            )
+        )
+        if not candidates:
+            return []
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        definitions = _python_definitions(scanned.content)
         findings: list[Finding] = []
-        for line_num, line in enumerate(scanned.content.splitlines(), start=1):
-            func_match = _PEP8_SNAKE_FUNC.search(line)
-            if func_match:
-                findings.append(
-                    Finding(
-                        severity="low",
-                        category="style",
-                        rule="pep8-naming",
-                        message=f"Function '{func_match.group(1)}' uses camelCase; PEP 8 prefers snake_case",
-                        file_path=scanned.path,
-                        line_number=line_num,
-                        snippet=line.strip()[:120],
-                    )
-                )
-
-            class_match = _PEP8_CLASS_NAME.search(line)
-            if class_match:
-                findings.append(
-                    Finding(
-                        severity="low",
-                        category="style",
-                        rule="pep8-naming",
-                        message=f"Class '{class_match.group(1)}' should use CapitalizedWords (PEP 8)",
-                        file_path=scanned.path,
-                        line_number=line_num,
-                        snippet=line.strip()[:120],
-                    )
+        for line_num, line, name, kind in candidates:
+            if definitions is not None and (line_num, name, kind) not in definitions:
+                continue
+            if kind == "function":
+                message = f"Function '{name}' uses camelCase; PEP 8 prefers snake_case"
+            else:
+                message = f"Class '{name}' should use CapitalizedWords (PEP 8)"
+            findings.append(
+                Finding(
+                    severity="low",
+                    category="style",
+                    rule="pep8-naming",
+                    message=message,
+                    file_path=scanned.path,
+                    line_number=line_num,
+                    snippet=line.strip()[:120],
                 )
+            )
 
         return findings
 
@@ -247,18 +415,18 @@ class StyleAnalyzer(BaseAnalyzer):
             Findings for naming violations.
         """
         findings: list[Finding] = []
-        for line_num, line in enumerate(scanned.content.splitlines(), start=1):
-            match = _JS_SNAKE_FUNC.search(line)
-            if match:
-                findings.append(
-                    Finding(
-                        severity="info",
-                        category="style",
-                        rule="js-naming-convention",
-                        message=f"'{match.group(1)}' uses snake_case; JS convention prefers camelCase",
-                        file_path=scanned.path,
-                        line_number=line_num,
-                        snippet=line.strip()[:120],
-                    )
+        content = scanned.content
+        matches = heapq.merge(*(pattern.finditer(content) for pattern in _JS_SNAKE_FUNCS), key=re.Match.start)
+        for line_num, line, match in _first_match_per_line(matches, content):
+            findings.append(
+                Finding(
+                    severity="info",
+                    category="style",
+                    rule="js-naming-convention",
+                    message=f"'{match.group(1)}' uses snake_case; JS convention prefers camelCase",
+                    file_path=scanned.path,
+                    line_number=line_num,
+                    snippet=line.strip()[:120],
                 )
+            )
         return findings
@@ -0,0 +1,104 @@
+"""Content-addressed cache of per-file analyzer results.
+
+Long-running servers rescan the same trees repeatedly.  A
+:class:`ScanCache` lets an analyzer skip files whose content has not
+changed since the last scan by keying results on a BLAKE2b digest of
+the file text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from mcp_factory.services.code_guardian.config import (
+    SCAN_CACHE_MAX_ENTRIES,
+    SCAN_CACHE_TTL_SECONDS,
+)
+from mcp_factory.services.code_guardian.models import Finding, ScannedFile
+
+CacheKey = tuple[str, str, bytes]
+"""(path, language, content digest) identifying one analyzed file."""
+
+
+class ScanCache:
+    """Thread-safe, bounded, in-memory map from file content to findings.
+
+    Entries expire after *ttl_seconds* and the least recently used
+    entry is evicted once *max_entries* is exceeded.
+
+    Args:
+        max_entries: Maximum number of files to remember.
+        ttl_seconds: Age in seconds after which an entry is ignored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SCAN_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = SCAN_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CacheKey, tuple[float, tuple[Finding, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(scanned: ScannedFile) -> CacheKey:
+        """Build the cache key for a scanned file.
+
+        The path and language are part of the key because findings
+        embed the path and rules are selected by language.
+
+        Args:
+            scanned: The file about to be analyzed.
+
+        Returns:
+            A hashable key for :meth:`get` and :meth:`put`.
+        """
+        digest = hashlib.blake2b(scanned.content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return scanned.path, scanned.language, digest
+
+    def get(self, key: CacheKey) -> list[Finding] | None:
+        """Return the findings stored under *key*, if still fresh.
+
+        Args:
+            key: A key from :meth:`key_for`.
+
+        Returns:
+            A new list of the cached findings, or ``None`` on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, findings = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(findings)
+
+    def put(self, key: CacheKey, findings: list[Finding]) -> None:
+        """Store *findings* under *key*, evicting old entries if full.
+
+        Args:
+            key: A key from :meth:`key_for`.
+            findings: The analyzer's findings for that file.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), tuple(findings))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, including expired ones."""
+        with self._lock:
+            return len(self._entries)
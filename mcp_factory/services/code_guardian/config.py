@@ -102,3 +102,9 @@ SEVERITY_LEVELS: tuple[str, ...] = (
     "info",
 )
 """Ordered severity levels from most to least severe."""
+
+SCAN_CACHE_MAX_ENTRIES: int = 2000
+"""Per-file results kept by :class:`ScanCache` before evicting the least recently used."""
+
+SCAN_CACHE_TTL_SECONDS: float = 86_400.0
+"""Age after which a cached per-file result is recomputed (24 hours)."""
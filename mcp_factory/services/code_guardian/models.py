@@ -9,17 +9,21 @@ Defines the value objects used throughout the analysis pipeline:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 
-SEVERITY_ORDER: dict[str, int] = {
+_SEVERITY_RANK: dict[str, int] = {
     "critical": 0,
     "high": 1,
     "medium": 2,
     "low": 3,
     "info": 4,
 }
-"""Ordering map so findings can be sorted most-severe-first."""
+
+SEVERITY_ORDER: Mapping[str, int] = MappingProxyType(_SEVERITY_RANK)
+"""Read-only ordering map so findings can be sorted most-severe-first."""
 
 
 @dataclass(frozen=True)
@@ -38,6 +42,23 @@ class ScannedFile:
     language: str
     line_count: int
 
+    @classmethod
+    def from_content(cls, path: str, content: str, language: str) -> ScannedFile:
+        """Build a ``ScannedFile``, counting the lines of *content*.
+
+        A final line without a trailing newline still counts as a line.
+
+        Args:
+            path: Absolute or relative path to the file.
+            content: Full text content of the file.
+            language: Detected programming language.
+
+        Returns:
+            The scanned file with ``line_count`` filled in.
+        """
+        line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+        return cls(path=path, content=content, language=language, line_count=line_count)
+
 
 @dataclass(frozen=True)
 class Finding:
@@ -89,7 +110,7 @@ class ScanResult:
         """
         return sorted(
             self.findings,
-            key=lambda f: SEVERITY_ORDER.get(f.severity, 99),
+            key=lambda f, _rank=_SEVERITY_RANK.get: _rank(f.severity, 99),
         )
 
     def counts_by_severity(self) -> dict[str, int]:
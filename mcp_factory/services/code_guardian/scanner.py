@@ -121,16 +121,11 @@ class FileScanner:
                     continue
 
                 rel_path = os.path.relpath(full_path, self.root)
-                line_count = content.count("\n") + (
-                    1 if content and not content.endswith("\n") else 0
-                )
-
                 results.append(
-                    ScannedFile(
+                    ScannedFile.from_content(
                         path=rel_path,
                         content=content,
                         language=language,
-                        line_count=line_count,
                     )
                 )
 
@@ -7,6 +7,7 @@ functions remain thin orchestrators.
 from __future__ import annotations
 
 import os
+import stat
 
 
 def validate_scan_path(path: str) -> str | None:
@@ -24,10 +25,12 @@ def validate_scan_path(path: str) -> str | None:
 
     expanded = os.path.expanduser(path.strip())
 
-    if not os.path.exists(expanded):
+    try:
+        mode = os.stat(expanded).st_mode
+    except (OSError, ValueError):
         return f"Path does not exist: {expanded}"
 
-    if not os.path.isdir(expanded):
+    if not stat.S_ISDIR(mode):
         return f"Path is not a directory: {expanded}"
 
     if not os.access(expanded, os.R_OK):
@@ -28,6 +28,7 @@ class ServiceRegistry:
 
     def __init__(self) -> None:
         self._plugins: list[ServicePlugin] = []
+        self._snapshot: tuple[ServicePlugin, ...] | None = None
 
     def add(self, plugin: ServicePlugin) -> None:
         """Register a service plugin for later application.
@@ -36,6 +37,7 @@ class ServiceRegistry:
             plugin: Any object satisfying the :class:`ServicePlugin` protocol.
         """
         self._plugins.append(plugin)
+        self._snapshot = None
         logger.info("Registered service plugin: %s", type(plugin).__name__)
 
     def apply_all(self, mcp: FastMCP) -> None:
@@ -51,6 +53,12 @@ class ServiceRegistry:
             logger.info("Applied service plugin: %s", type(plugin).__name__)
 
     @property
-    def plugins(self) -> list[ServicePlugin]:
-        """Read-only view of registered plugins (useful for testing)."""
-        return list(self._plugins)
+    def plugins(self) -> tuple[ServicePlugin, ...]:
+        """Immutable snapshot of registered plugins (useful for testing).
+
+        The tuple is built on first access after an :meth:`add` and
+        shared by later reads.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._plugins)
+        return self._snapshot
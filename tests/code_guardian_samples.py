@@ -0,0 +1,47 @@
+"""Sample dependency manifests shared by the Code Guardian test modules."""
+
+SAMPLE_PACKAGE_JSON = """{
+  "name": "my-app",
+  "dependencies": {
+    "express": "^4.18.2",
+    "lodash": "~4.17.21"
+  },
+  "devDependencies": {
+    "jest": "^29.0.0"
+  }
+}"""
+
+SAMPLE_REQUIREMENTS_TXT = """flask>=2.3.0
+requests==2.31.0
+numpy
+# comment
+-r other.txt
+"""
+
+SAMPLE_GO_MOD = """module example.com/myapp
+
+go 1.21
+
+require (
+    github.com/gin-gonic/gin v1.9.1
+    golang.org/x/text v0.13.0
+)
+"""
+
+SAMPLE_CARGO_TOML = """[package]
+name = "my-app"
+
+[dependencies]
+serde = "1.0"
+tokio = "1.32"
+"""
+
+SAMPLE_GEMFILE_LOCK = """GEM
+  remote: https://rubygems.org/
+  specs:
+    rails (7.0.8)
+    nokogiri (1.15.4)
+
+PLATFORMS
+  ruby
+"""
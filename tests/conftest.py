@@ -0,0 +1,68 @@
+"""Shared pytest fixtures for the MCP Factory test suite."""
+
+import asyncio
+from collections.abc import Callable, Iterator
+
+import pytest
+import respx
+
+from mcp_factory.services.code_guardian.analyzers.debug_statements import DebugStatementAnalyzer
+from mcp_factory.services.code_guardian.analyzers.dependencies import DependencyAnalyzer
+from mcp_factory.services.code_guardian.formatter import CodeGuardianFormatter
+from mcp_factory.services.code_guardian.models import ScannedFile
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _session_router() -> Iterator[respx.MockRouter]:
+    """Patch the httpx transport once for the whole test session.
+
+    Requests that match no route on this router fall through to any
+    router a test opens itself (e.g. via ``@respx.mock``), so existing
+    decorator-based tests keep working unchanged.
+    """
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture()
+def respx_mock(_session_router: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """Expose the session router to a single test.
+
+    Routes and recorded calls added during the test are rolled back
+    afterwards so nothing leaks into the next test.
+    """
+    _session_router.snapshot()
+    yield _session_router
+    _session_router.rollback()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup() -> None:
+    """Exercise the analyzer and formatter hot paths once per session.
+
+    Pays one-time import and first-call costs up front so the first
+    test in a module is not charged for them and per-test timings
+    stay representative.
+    """
+    asyncio.run(
+        DebugStatementAnalyzer().analyze(
+            [ScannedFile(path="w.py", content="pass\n", language="python", line_count=1)]
+        )
+    )
+    DependencyAnalyzer._parse_package_json("{}")
+    CodeGuardianFormatter().format({"findings": [], "files_scanned": 0, "analyzers_run": []})
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]] | None:
+    """Run async tests on uvloop when it is installed.
+
+    uvloop is a dev dependency on non-Windows platforms; elsewhere the
+    default asyncio loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return {"uvloop": uvloop.new_event_loop}
@@ -1,7 +1,6 @@
 """Tests for mcp_factory.services.apod.client using respx to mock httpx."""
 
 import httpx
-import pytest
 import respx
 
 from mcp_factory.services.apod.client import ApodClient
@@ -25,7 +24,6 @@ def _make_client() -> ApodClient:
     )
 
 
-@pytest.mark.asyncio
 class TestApodClient:
     """Verify ApodClient behavior for success and failure scenarios."""
 
@@ -42,7 +42,6 @@ class TestBaseAPIClient:
         with pytest.raises(TypeError):
             BaseAPIClient(base_url="x", api_key="y")  # type: ignore[abstract]
 
-    @pytest.mark.asyncio
     async def test_concrete_fetch_returns_data(self) -> None:
         client = ConcreteClient(base_url="https://example.com", api_key="k")
         result = await client.fetch(date="2024-01-01")
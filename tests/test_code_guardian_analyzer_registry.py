@@ -2,7 +2,12 @@
 
 import pytest
 
-from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer, AnalyzerRegistry
+from mcp_factory.services.code_guardian.analyzers import BaseAnalyzer, AnalyzerRegistry, _rules_with_hints
+from mcp_factory.services.code_guardian.analyzers.code_quality import CodeQualityAnalyzer
+from mcp_factory.services.code_guardian.analyzers.debug_statements import DebugStatementAnalyzer
+from mcp_factory.services.code_guardian.analyzers.secrets import SecretAnalyzer
+from mcp_factory.services.code_guardian.analyzers.security_patterns import SecurityPatternAnalyzer
+from mcp_factory.services.code_guardian.analyzers.style import StyleAnalyzer
 from mcp_factory.services.code_guardian.models import Finding, ScannedFile
 
 
@@ -43,11 +48,10 @@ class TestBaseAnalyzer:
         assert stub.category == "general"
 
 
-@pytest.mark.asyncio
 class TestAnalyzerRegistry:
     """Verify registration, ordering, and orchestration."""
 
-    async def test_add_and_list_analyzers(self) -> None:
+    def test_add_and_list_analyzers(self) -> None:
         registry = AnalyzerRegistry()
         a1 = _StubAnalyzer("first", "security")
         a2 = _StubAnalyzer("second", "quality")
@@ -93,3 +97,46 @@ class TestAnalyzerRegistry:
         result = await registry.run_by_category("quality", DUMMY_FILES)
         assert result.findings == []
         assert result.analyzers_run == []
+
+
+class TestRulesWithHints:
+    """Verify the whole-file hint filter shared by the pattern analyzers."""
+
+    def test_keeps_rules_whose_hint_occurs_in_any_case(self) -> None:
+        rules = [("upper", 1), ("absent", 2), ("either", 3)]
+        hints = {"upper": ("token",), "absent": ("md5",), "either": ("nope", "key")}
+        assert _rules_with_hints("API_KEY = TOKEN", rules, hints) == [("upper", 1), ("either", 3)]
+
+
+class TestLineNumbering:
+    """Verify every analyzer numbers the same source line the same way."""
+
+    @pytest.mark.parametrize("separator", ["\x0c", "\x1c", "\x1e", "\x85", "\u2028"])
+    async def test_analyzers_agree_past_unicode_line_separators(self, separator: str) -> None:
+        content = (
+            "import os\n"
+            f"{separator}\n"
+            "password = 'hunter2hunter2'  # TODO rotate\n"
+            "print('x')  \n"
+            "result = eval(data)\n"
+            f"value = '{'v' * 130}'\n"
+        )
+        registry = AnalyzerRegistry()
+        for analyzer in (
+            SecretAnalyzer(),
+            SecurityPatternAnalyzer(),
+            DebugStatementAnalyzer(),
+            CodeQualityAnalyzer(),
+            StyleAnalyzer(),
+        ):
+            registry.add(analyzer)
+
+        result = await registry.run_all([ScannedFile.from_content("a.py", content, "python")])
+        assert {(f.rule, f.line_number) for f in result.findings} >= {
+            ("generic-secret", 3),
+            ("todo-comment", 3),
+            ("debug-statement", 4),
+            ("trailing-whitespace", 4),
+            ("eval-usage", 5),
+            ("line-too-long", 6),
+        }
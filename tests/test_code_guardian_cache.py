@@ -0,0 +1,77 @@
+"""Tests for mcp_factory.services.code_guardian.cache."""
+
+from mcp_factory.services.code_guardian.analyzers.style import StyleAnalyzer
+from mcp_factory.services.code_guardian.cache import ScanCache
+from mcp_factory.services.code_guardian.models import Finding, ScannedFile
+
+
+def _file(content: str, path: str = "a.py", language: str = "python") -> ScannedFile:
+    """Build a scanned file for cache tests."""
+    return ScannedFile.from_content(path=path, content=content, language=language)
+
+
+_FINDING = Finding(severity="info", category="style", rule="r", message="m", file_path="a.py", line_number=1)
+
+
+class TestScanCache:
+    """Verify keying, expiry, and eviction."""
+
+    def test_miss_then_hit(self) -> None:
+        cache = ScanCache()
+        key = ScanCache.key_for(_file("x = 1\n"))
+        assert cache.get(key) is None
+        cache.put(key, [_FINDING])
+        assert cache.get(key) == [_FINDING]
+
+    def test_hit_returns_fresh_list(self) -> None:
+        cache = ScanCache()
+        key = ScanCache.key_for(_file("x = 1\n"))
+        cache.put(key, [_FINDING])
+        cache.get(key).clear()
+        assert cache.get(key) == [_FINDING]
+
+    def test_key_depends_on_content_path_and_language(self) -> None:
+        base = ScanCache.key_for(_file("x = 1\n"))
+        assert ScanCache.key_for(_file("x = 1\n")) == base
+        assert ScanCache.key_for(_file("x = 2\n")) != base
+        assert ScanCache.key_for(_file("x = 1\n", path="b.py")) != base
+        assert ScanCache.key_for(_file("x = 1\n", language="text")) != base
+
+    def test_expired_entries_are_dropped(self) -> None:
+        cache = ScanCache(ttl_seconds=-1)
+        key = ScanCache.key_for(_file("x = 1\n"))
+        cache.put(key, [_FINDING])
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ScanCache(max_entries=2)
+        keys = [ScanCache.key_for(_file(f"x = {i}\n")) for i in range(3)]
+        cache.put(keys[0], [])
+        cache.put(keys[1], [])
+        cache.get(keys[0])
+        cache.put(keys[2], [])
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == []
+        assert len(cache) == 2
+
+
+class TestStyleAnalyzerCache:
+    """Verify StyleAnalyzer answers unchanged files from its cache."""
+
+    async def test_unchanged_file_is_not_rescanned(self, monkeypatch) -> None:
+        analyzer = StyleAnalyzer(cache=ScanCache())
+        files = [_file("x = 1   \n")]
+        first = await analyzer.analyze(files)
+
+        def _fail(scanned: ScannedFile) -> list[Finding]:
+            raise AssertionError(f"{scanned.path} was rescanned")
+
+        monkeypatch.setattr(analyzer, "_scan_file", _fail)
+        assert await analyzer.analyze(files) == first
+
+    async def test_changed_file_is_rescanned(self) -> None:
+        analyzer = StyleAnalyzer(cache=ScanCache())
+        await analyzer.analyze([_file("x = 1   \n")])
+        findings = await analyzer.analyze([_file("x = 1\n")])
+        assert findings == []
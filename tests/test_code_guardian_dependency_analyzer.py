@@ -8,52 +8,29 @@ from mcp_factory.services.code_guardian.analyzers.dependencies import Dependency
 from mcp_factory.services.code_guardian.config import OSV_API_BASE_URL
 from mcp_factory.services.code_guardian.models import ScannedFile
 from mcp_factory.services.code_guardian.osv_client import OsvClient
-
-SAMPLE_PACKAGE_JSON = """{
-  "name": "my-app",
-  "dependencies": {
-    "express": "^4.18.2",
-    "lodash": "~4.17.21"
-  },
-  "devDependencies": {
-    "jest": "^29.0.0"
-  }
-}"""
-
-SAMPLE_REQUIREMENTS_TXT = """flask>=2.3.0
-requests==2.31.0
-numpy
-# comment
--r other.txt
-"""
-
-SAMPLE_GO_MOD = """module example.com/myapp
-
-go 1.21
-
-require (
-    github.com/gin-gonic/gin v1.9.1
-    golang.org/x/text v0.13.0
+from tests.code_guardian_samples import (
+    SAMPLE_CARGO_TOML,
+    SAMPLE_GEMFILE_LOCK,
+    SAMPLE_GO_MOD,
+    SAMPLE_PACKAGE_JSON,
+    SAMPLE_REQUIREMENTS_TXT,
 )
-"""
-
-SAMPLE_CARGO_TOML = """[package]
-name = "my-app"
-
-[dependencies]
-serde = "1.0"
-tokio = "1.32"
-"""
 
-SAMPLE_GEMFILE_LOCK = """GEM
-  remote: https://rubygems.org/
-  specs:
-    rails (7.0.8)
-    nokogiri (1.15.4)
+PACKAGE_JSON_FILES: tuple[ScannedFile, ...] = (
+    ScannedFile.from_content(
+        path="package.json",
+        content=SAMPLE_PACKAGE_JSON,
+        language="json",
+    ),
+)
 
-PLATFORMS
-  ruby
-"""
+REQUIREMENTS_TXT_FILES: tuple[ScannedFile, ...] = (
+    ScannedFile.from_content(
+        path="requirements.txt",
+        content=SAMPLE_REQUIREMENTS_TXT,
+        language="text",
+    ),
+)
 
 
 def _make_client() -> OsvClient:
@@ -61,11 +38,6 @@ def _make_client() -> OsvClient:
     return OsvClient(base_url=OSV_API_BASE_URL, api_key="", timeout=10.0)
 
 
-def _make_file(content: str, path: str, language: str = "json") -> list[ScannedFile]:
-    """Wrap manifest content in a single-file list."""
-    return [ScannedFile(path=path, content=content, language=language, line_count=content.count("\n") + 1)]
-
-
 VULN_RESPONSE = {
     "vulns": [
         {
@@ -127,51 +99,46 @@ class TestDependencyParsing:
         assert deps == []
 
 
-@pytest.mark.asyncio
 class TestDependencyAnalyzer:
     """Verify end-to-end dependency analysis with mocked OSV."""
 
-    async def test_name_and_category(self) -> None:
+    def test_name_and_category(self) -> None:
         analyzer = DependencyAnalyzer(_make_client())
         assert analyzer.name == "dependency-analyzer"
         assert analyzer.category == "vulnerability"
 
-    @respx.mock
-    async def test_finds_vulnerabilities_in_package_json(self) -> None:
-        respx.post(f"{OSV_API_BASE_URL}/query").mock(
+    async def test_finds_vulnerabilities_in_package_json(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.post(f"{OSV_API_BASE_URL}/query").mock(
             return_value=httpx.Response(200, json=VULN_RESPONSE)
         )
         analyzer = DependencyAnalyzer(_make_client())
-        files = _make_file(SAMPLE_PACKAGE_JSON, "package.json")
+        files = list(PACKAGE_JSON_FILES)
         findings = await analyzer.analyze(files)
         assert len(findings) >= 1
         assert all(f.rule == "known-vulnerability" for f in findings)
         assert any("GHSA-test-vuln" in f.message for f in findings)
 
-    @respx.mock
-    async def test_no_findings_for_clean_deps(self) -> None:
-        respx.post(f"{OSV_API_BASE_URL}/query").mock(
+    async def test_no_findings_for_clean_deps(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.post(f"{OSV_API_BASE_URL}/query").mock(
             return_value=httpx.Response(200, json=EMPTY_RESPONSE)
         )
         analyzer = DependencyAnalyzer(_make_client())
-        files = _make_file(SAMPLE_REQUIREMENTS_TXT, "requirements.txt", language="text")
+        files = list(REQUIREMENTS_TXT_FILES)
         findings = await analyzer.analyze(files)
         assert len(findings) == 0
 
-    @respx.mock
-    async def test_skips_non_manifest_files(self) -> None:
+    async def test_skips_non_manifest_files(self, respx_mock: respx.MockRouter) -> None:
         analyzer = DependencyAnalyzer(_make_client())
         files = [ScannedFile(path="app.py", content="x=1\n", language="python", line_count=1)]
         findings = await analyzer.analyze(files)
         assert len(findings) == 0
 
-    @respx.mock
-    async def test_handles_api_failure_gracefully(self) -> None:
-        respx.post(f"{OSV_API_BASE_URL}/query").mock(
+    async def test_handles_api_failure_gracefully(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.post(f"{OSV_API_BASE_URL}/query").mock(
             return_value=httpx.Response(500, text="Server Error")
         )
         analyzer = DependencyAnalyzer(_make_client())
-        files = _make_file(SAMPLE_PACKAGE_JSON, "package.json")
+        files = list(PACKAGE_JSON_FILES)
         findings = await analyzer.analyze(files)
         assert len(findings) == 0
 
@@ -179,26 +146,16 @@ class TestDependencyAnalyzer:
 class TestSeverityMapping:
     """Verify CVSS-to-severity mapping (synchronous, no async mark)."""
 
-    def test_severity_mapping_critical(self) -> None:
-        vuln = {"severity": [{"score": "9.5"}]}
-        assert DependencyAnalyzer._determine_severity(vuln) == "critical"
-
-    def test_severity_mapping_high(self) -> None:
-        vuln = {"severity": [{"score": "7.5"}]}
-        assert DependencyAnalyzer._determine_severity(vuln) == "high"
-
-    def test_severity_mapping_medium(self) -> None:
-        vuln = {"severity": [{"score": "5.0"}]}
-        assert DependencyAnalyzer._determine_severity(vuln) == "medium"
-
-    def test_severity_mapping_low(self) -> None:
-        vuln = {"severity": [{"score": "2.0"}]}
-        assert DependencyAnalyzer._determine_severity(vuln) == "low"
-
-    def test_severity_fallback_to_database_specific(self) -> None:
-        vuln = {"database_specific": {"severity": "CRITICAL"}}
-        assert DependencyAnalyzer._determine_severity(vuln) == "critical"
-
-    def test_severity_fallback_default_high(self) -> None:
-        vuln = {}
-        assert DependencyAnalyzer._determine_severity(vuln) == "high"
+    @pytest.mark.parametrize(
+        ("vuln", "expected"),
+        [
+            pytest.param({"severity": [{"score": "9.5"}]}, "critical", id="cvss-critical"),
+            pytest.param({"severity": [{"score": "7.5"}]}, "high", id="cvss-high"),
+            pytest.param({"severity": [{"score": "5.0"}]}, "medium", id="cvss-medium"),
+            pytest.param({"severity": [{"score": "2.0"}]}, "low", id="cvss-low"),
+            pytest.param({"database_specific": {"severity": "CRITICAL"}}, "critical", id="database-specific"),
+            pytest.param({}, "high", id="default-high"),
+        ],
+    )
+    def test_severity_mapping(self, vuln: dict, expected: str) -> None:
+        assert DependencyAnalyzer._determine_severity(vuln) == expected
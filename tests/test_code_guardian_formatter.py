@@ -41,43 +41,44 @@ def _sample_result() -> ScanResult:
     )
 
 
+@pytest.fixture(scope="module")
+def sample_data() -> dict:
+    """Convert :func:`_sample_result` to a dict once per module."""
+    return CodeGuardianFormatter.scan_result_to_dict(_sample_result())
+
+
 class TestCodeGuardianFormatter:
     """Verify Markdown report generation."""
 
-    def test_format_includes_summary(self) -> None:
+    def test_format_includes_summary(self, sample_data: dict) -> None:
         fmt = CodeGuardianFormatter()
-        data = fmt.scan_result_to_dict(_sample_result())
-        report = fmt.format(data)
+        report = fmt.format(sample_data)
         assert "Code Guardian Scan Report" in report
         assert "Files scanned:** 12" in report
         assert "Total findings:** 3" in report
 
-    def test_format_groups_by_severity(self) -> None:
+    def test_format_groups_by_severity(self, sample_data: dict) -> None:
         fmt = CodeGuardianFormatter()
-        data = fmt.scan_result_to_dict(_sample_result())
-        report = fmt.format(data)
+        report = fmt.format(sample_data)
         assert "CRITICAL" in report
         assert "MEDIUM" in report
         assert "LOW" in report
 
-    def test_format_includes_finding_details(self) -> None:
+    def test_format_includes_finding_details(self, sample_data: dict) -> None:
         fmt = CodeGuardianFormatter()
-        data = fmt.scan_result_to_dict(_sample_result())
-        report = fmt.format(data)
+        report = fmt.format(sample_data)
         assert "exposed-api-key" in report
         assert "AWS key found" in report
         assert "config.py:10" in report
 
-    def test_format_includes_snippet_when_present(self) -> None:
+    def test_format_includes_snippet_when_present(self, sample_data: dict) -> None:
         fmt = CodeGuardianFormatter()
-        data = fmt.scan_result_to_dict(_sample_result())
-        report = fmt.format(data)
+        report = fmt.format(sample_data)
         assert "AKIA" in report
 
-    def test_format_with_header(self) -> None:
+    def test_format_with_header(self, sample_data: dict) -> None:
         fmt = CodeGuardianFormatter()
-        data = fmt.scan_result_to_dict(_sample_result())
-        report = fmt.format(data, header="**Custom Header**")
+        report = fmt.format(sample_data, header="**Custom Header**")
         assert report.startswith("**Custom Header**")
 
     def test_format_empty_result(self) -> None:
@@ -93,18 +94,16 @@ class TestCodeGuardianFormatter:
         report = fmt.format_scan_result(_sample_result())
         assert "Code Guardian Scan Report" in report
 
-    def test_scan_result_to_dict_structure(self) -> None:
-        fmt = CodeGuardianFormatter()
-        data = fmt.scan_result_to_dict(_sample_result())
+    def test_scan_result_to_dict_structure(self, sample_data: dict) -> None:
+        data = sample_data
         assert "findings" in data
         assert "files_scanned" in data
         assert "analyzers_run" in data
         assert isinstance(data["findings"], list)
         assert data["files_scanned"] == 12
 
-    def test_format_includes_analyzers_run(self) -> None:
+    def test_format_includes_analyzers_run(self, sample_data: dict) -> None:
         fmt = CodeGuardianFormatter()
-        data = fmt.scan_result_to_dict(_sample_result())
-        report = fmt.format(data)
+        report = fmt.format(sample_data)
         assert "secret-scanner" in report
         assert "style-analyzer" in report
@@ -10,6 +10,17 @@ from mcp_factory.services.code_guardian.models import (
 )
 
 
+_FINDINGS: tuple[Finding, ...] = (
+    Finding(severity="low", category="quality", rule="r1", message="m1", file_path="a.py"),
+    Finding(severity="critical", category="security", rule="r2", message="m2", file_path="b.py"),
+    Finding(severity="medium", category="style", rule="r3", message="m3", file_path="c.py"),
+    Finding(severity="critical", category="security", rule="r4", message="m4", file_path="d.py"),
+    Finding(severity="high", category="security", rule="r5", message="m5", file_path="e.py"),
+)
+
+_EXPECTED_SORTED: tuple[str, ...] = ("critical", "critical", "high", "medium", "low")
+
+
 class TestScannedFile:
     """Verify ScannedFile immutability and field access."""
 
@@ -19,6 +30,13 @@ class TestScannedFile:
         assert sf.language == "python"
         assert sf.line_count == 1
 
+    def test_from_content_counts_lines(self) -> None:
+        counts = [
+            ScannedFile.from_content(path="a.py", content=content, language="python").line_count
+            for content in ("", "x = 1", "x = 1\n", "x = 1\ny = 2")
+        ]
+        assert counts == [0, 1, 1, 2]
+
     def test_frozen_prevents_mutation(self) -> None:
         sf = ScannedFile(path="a.py", content="", language="python", line_count=0)
         with pytest.raises(AttributeError):
@@ -68,15 +86,6 @@ class TestFinding:
 class TestScanResult:
     """Verify ScanResult aggregation helpers."""
 
-    def _make_findings(self) -> list[Finding]:
-        return [
-            Finding(severity="low", category="quality", rule="r1", message="m1", file_path="a.py"),
-            Finding(severity="critical", category="security", rule="r2", message="m2", file_path="b.py"),
-            Finding(severity="medium", category="style", rule="r3", message="m3", file_path="c.py"),
-            Finding(severity="critical", category="security", rule="r4", message="m4", file_path="d.py"),
-            Finding(severity="high", category="security", rule="r5", message="m5", file_path="e.py"),
-        ]
-
     def test_default_empty(self) -> None:
         result = ScanResult()
         assert result.findings == []
@@ -84,13 +93,22 @@ class TestScanResult:
         assert result.analyzers_run == []
 
     def test_sorted_findings_orders_by_severity(self) -> None:
-        result = ScanResult(findings=self._make_findings(), files_scanned=5, analyzers_run=["a"])
-        sorted_f = result.sorted_findings()
-        severities = [f.severity for f in sorted_f]
-        assert severities == ["critical", "critical", "high", "medium", "low"]
+        result = ScanResult(findings=list(_FINDINGS), files_scanned=5, analyzers_run=["a"])
+        assert tuple(f.severity for f in result.sorted_findings()) == _EXPECTED_SORTED
+
+    def test_sorted_findings_large_list(self) -> None:
+        result = ScanResult(findings=list(_FINDINGS) * 2000, files_scanned=5, analyzers_run=["a"])
+        severities = [f.severity for f in result.sorted_findings()]
+        assert severities == sorted(severities, key=SEVERITY_ORDER.__getitem__)
+        assert severities[:4000] == ["critical"] * 4000
+
+    def test_sorted_findings_places_unknown_severity_last(self) -> None:
+        odd = Finding(severity="unknown", category="style", rule="r6", message="m6", file_path="f.py")
+        result = ScanResult(findings=[odd, *_FINDINGS])
+        assert result.sorted_findings()[-1] is odd
 
     def test_counts_by_severity(self) -> None:
-        result = ScanResult(findings=self._make_findings(), files_scanned=5, analyzers_run=["a"])
+        result = ScanResult(findings=list(_FINDINGS), files_scanned=5, analyzers_run=["a"])
         counts = result.counts_by_severity()
         assert counts == {"critical": 2, "high": 1, "medium": 1, "low": 1}
 
@@ -101,5 +119,9 @@ class TestSeverityOrder:
     def test_critical_is_most_severe(self) -> None:
         assert SEVERITY_ORDER["critical"] < SEVERITY_ORDER["info"]
 
+    def test_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            SEVERITY_ORDER["critical"] = 9  # type: ignore[index]
+
     def test_all_levels_present(self) -> None:
         assert set(SEVERITY_ORDER.keys()) == {"critical", "high", "medium", "low", "info"}
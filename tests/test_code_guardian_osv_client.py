@@ -1,5 +1,7 @@
 """Tests for mcp_factory.services.code_guardian.osv_client using respx."""
 
+from collections.abc import Iterator
+
 import httpx
 import pytest
 import respx
@@ -8,11 +10,29 @@ from mcp_factory.services.code_guardian.config import OSV_API_BASE_URL
 from mcp_factory.services.code_guardian.osv_client import OsvClient
 
 
-def _make_client() -> OsvClient:
-    """Create an OsvClient wired to the real OSV base URL for testing."""
+@pytest.fixture(scope="module")
+def client() -> OsvClient:
+    """Provide an OsvClient wired to the real OSV base URL for testing."""
     return OsvClient(base_url=OSV_API_BASE_URL, api_key="", timeout=10.0)
 
 
+@pytest.fixture(scope="module")
+def _osv_route() -> Iterator[respx.Route]:
+    """Register the OSV ``/query`` route once for the whole module."""
+    with respx.mock(base_url=OSV_API_BASE_URL, assert_all_called=False) as router:
+        yield router.post("/query")
+
+
+@pytest.fixture()
+def osv_route(_osv_route: respx.Route) -> Iterator[respx.Route]:
+    """Expose the shared OSV route, clearing recorded calls afterwards.
+
+    Each test sets its own response via ``osv_route.mock(...)``.
+    """
+    yield _osv_route
+    _osv_route.reset()
+
+
 SAMPLE_VULN_RESPONSE: dict = {
     "vulns": [
         {
@@ -26,67 +46,52 @@ SAMPLE_VULN_RESPONSE: dict = {
 EMPTY_RESPONSE: dict = {"vulns": []}
 
 
-@pytest.mark.asyncio
 class TestOsvClient:
     """Verify OsvClient HTTP behavior for success and failure paths."""
 
-    @respx.mock
-    async def test_successful_query_returns_vulns(self) -> None:
-        respx.post(f"{OSV_API_BASE_URL}/query").mock(
+    async def test_successful_query_returns_vulns(self, client: OsvClient, osv_route: respx.Route) -> None:
+        osv_route.mock(
             return_value=httpx.Response(200, json=SAMPLE_VULN_RESPONSE)
         )
-        client = _make_client()
         result = await client.fetch(name="example-package", ecosystem="PyPI")
         assert result is not None
         assert len(result["vulns"]) == 1
         assert result["vulns"][0]["id"] == "GHSA-1234-5678-abcd"
 
-    @respx.mock
-    async def test_empty_vulns_response(self) -> None:
-        respx.post(f"{OSV_API_BASE_URL}/query").mock(
+    async def test_empty_vulns_response(self, client: OsvClient, osv_route: respx.Route) -> None:
+        osv_route.mock(
             return_value=httpx.Response(200, json=EMPTY_RESPONSE)
         )
-        client = _make_client()
         result = await client.fetch(name="safe-package", ecosystem="npm")
         assert result is not None
         assert result["vulns"] == []
 
-    @respx.mock
-    async def test_http_error_returns_none(self) -> None:
-        respx.post(f"{OSV_API_BASE_URL}/query").mock(
+    async def test_http_error_returns_none(self, client: OsvClient, osv_route: respx.Route) -> None:
+        osv_route.mock(
             return_value=httpx.Response(500, text="Internal Server Error")
         )
-        client = _make_client()
         result = await client.fetch(name="pkg", ecosystem="PyPI")
         assert result is None
 
-    @respx.mock
-    async def test_network_error_returns_none(self) -> None:
-        respx.post(f"{OSV_API_BASE_URL}/query").mock(
+    async def test_network_error_returns_none(self, client: OsvClient, osv_route: respx.Route) -> None:
+        osv_route.mock(
             side_effect=httpx.ConnectError("Connection refused")
         )
-        client = _make_client()
         result = await client.fetch(name="pkg", ecosystem="PyPI")
         assert result is None
 
-    @respx.mock
-    async def test_missing_name_returns_none(self) -> None:
-        client = _make_client()
+    async def test_missing_name_returns_none(self, client: OsvClient) -> None:
         result = await client.fetch(ecosystem="PyPI")
         assert result is None
 
-    @respx.mock
-    async def test_missing_ecosystem_returns_none(self) -> None:
-        client = _make_client()
+    async def test_missing_ecosystem_returns_none(self, client: OsvClient) -> None:
         result = await client.fetch(name="pkg")
         assert result is None
 
-    @respx.mock
-    async def test_sends_version_when_provided(self) -> None:
-        route = respx.post(f"{OSV_API_BASE_URL}/query").mock(
+    async def test_sends_version_when_provided(self, client: OsvClient, osv_route: respx.Route) -> None:
+        route = osv_route.mock(
             return_value=httpx.Response(200, json=EMPTY_RESPONSE)
         )
-        client = _make_client()
         await client.fetch(name="pkg", ecosystem="PyPI", version="1.2.3")
         assert route.called
         request_body = route.calls[0].request.content.decode()
@@ -0,0 +1,84 @@
+"""Benchmarks for Code Guardian manifest parsing, models and report formatting.
+
+Benchmarking is disabled by default (see ``[tool.pytest.ini_options]``),
+so these run once as ordinary tests.  Collect timings with::
+
+    uv run pytest tests/test_code_guardian_perf.py --benchmark-enable --benchmark-only
+"""
+
+from mcp_factory.services.code_guardian.analyzers.dependencies import DependencyAnalyzer
+from mcp_factory.services.code_guardian.formatter import CodeGuardianFormatter
+from mcp_factory.services.code_guardian.models import Finding, ScanResult
+from tests.code_guardian_samples import (
+    SAMPLE_CARGO_TOML,
+    SAMPLE_GEMFILE_LOCK,
+    SAMPLE_GO_MOD,
+    SAMPLE_PACKAGE_JSON,
+    SAMPLE_REQUIREMENTS_TXT,
+)
+
+SAMPLE_RESULT = ScanResult(
+    findings=[
+        Finding(
+            severity=severity,
+            category="security",
+            rule=f"rule-{i}",
+            message=f"Issue number {i}",
+            file_path=f"src/module_{i % 10}.py",
+            line_number=i + 1,
+            snippet=f"value_{i} = compute({i})",
+        )
+        for i, severity in enumerate(["critical", "high", "medium", "low", "info"] * 20)
+    ],
+    files_scanned=10,
+    analyzers_run=["secret-scanner", "style-analyzer"],
+)
+
+SAMPLE_DATA = CodeGuardianFormatter.scan_result_to_dict(SAMPLE_RESULT)
+
+
+class TestParsePerf:
+    """Track the cost of each manifest parser."""
+
+    def test_parse_package_json_perf(self, benchmark) -> None:
+        deps = benchmark(DependencyAnalyzer._parse_package_json, SAMPLE_PACKAGE_JSON)
+        assert len(deps) == 3
+
+    def test_parse_requirements_txt_perf(self, benchmark) -> None:
+        deps = benchmark(DependencyAnalyzer._parse_requirements_txt, SAMPLE_REQUIREMENTS_TXT)
+        assert len(deps) == 3
+
+    def test_parse_go_mod_perf(self, benchmark) -> None:
+        deps = benchmark(DependencyAnalyzer._parse_go_mod, SAMPLE_GO_MOD)
+        assert len(deps) == 2
+
+    def test_parse_cargo_toml_perf(self, benchmark) -> None:
+        deps = benchmark(DependencyAnalyzer._parse_cargo_toml, SAMPLE_CARGO_TOML)
+        assert len(deps) == 2
+
+    def test_parse_gemfile_lock_perf(self, benchmark) -> None:
+        deps = benchmark(DependencyAnalyzer._parse_gemfile_lock, SAMPLE_GEMFILE_LOCK)
+        assert len(deps) == 2
+
+
+class TestFormatterPerf:
+    """Track the cost of rendering a report."""
+
+    def test_format_perf(self, benchmark) -> None:
+        report = benchmark(CodeGuardianFormatter().format, SAMPLE_DATA)
+        assert "Total findings:** 100" in report
+
+    def test_scan_result_to_dict_perf(self, benchmark) -> None:
+        data = benchmark(CodeGuardianFormatter.scan_result_to_dict, SAMPLE_RESULT)
+        assert len(data["findings"]) == 100
+
+
+class TestModelPerf:
+    """Track the cost of ScanResult aggregation helpers."""
+
+    def test_sorted_findings_perf(self, benchmark) -> None:
+        result = ScanResult(findings=SAMPLE_RESULT.findings * 100)
+        ordered = benchmark(result.sorted_findings)
+        assert len(ordered) == 10_000
+        assert ordered[0].severity == "critical"
+        assert ordered[-1].severity == "info"
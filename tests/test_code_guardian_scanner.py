@@ -1,114 +1,98 @@
 """Tests for mcp_factory.services.code_guardian.scanner."""
 
 import os
-import tempfile
+from pathlib import Path
 
 import pytest
 
+from mcp_factory.services.code_guardian.models import ScannedFile
 from mcp_factory.services.code_guardian.scanner import FileScanner
 
 
-def _create_tree(base: str, structure: dict[str, str | dict]) -> None:
+def _create_tree(base: Path, structure: dict[str, str | bytes | dict]) -> None:
     """Recursively create files and directories under *base*.
 
     Args:
         base: Root directory.
-        structure: Mapping of names to content strings (files) or
-                   nested dicts (subdirectories).
+        structure: Mapping of names to content (``str`` or ``bytes``
+                   for files) or nested dicts (subdirectories).
     """
     for name, value in structure.items():
-        path = os.path.join(base, name)
+        path = base / name
         if isinstance(value, dict):
-            os.makedirs(path, exist_ok=True)
+            path.mkdir(parents=True, exist_ok=True)
             _create_tree(path, value)
         else:
-            with open(path, "w", encoding="utf-8") as fh:
-                fh.write(value)
+            path.write_bytes(value.encode() if isinstance(value, str) else value)
+
+
+@pytest.fixture(scope="module")
+def shared_tree(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Build one canonical sample tree shared by the read-only tests."""
+    base = tmp_path_factory.mktemp("scanner")
+    _create_tree(base, {
+        "app.py": "x = 1\n",
+        "index.js": "const a = 1;\n",
+        "app.ts": "const x: number = 1;\n",
+        "Main.java": "class Main {}\n",
+        "lib.rs": "fn main() {}\n",
+        "three_lines.py": "a\nb\nc\n",
+        "big.py": "x" * 200,
+        "photo.png": "binary",
+        "data.bin": "binary",
+        "src": {"main.py": "pass\n"},
+        "node_modules": {"dep.js": "module.exports = {};\n"},
+        "__pycache__": {"cached.py": "cached\n"},
+        "sub": {"deep.py": "pass\n"},
+        "bad.py": b"\x80\x81\x82\x83",
+    })
+    return str(base)
+
+
+@pytest.fixture(scope="module")
+async def shared_scan(shared_tree: str) -> dict[str, ScannedFile]:
+    """Scan :func:`shared_tree` once and index the results by path."""
+    files = await FileScanner(shared_tree).scan()
+    return {f.path: f for f in files}
 
 
-@pytest.mark.asyncio
 class TestFileScanner:
     """Verify directory walking, filtering, and language detection."""
 
-    async def test_scans_supported_files(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            _create_tree(tmp, {
-                "app.py": "x = 1\n",
-                "index.js": "const a = 1;\n",
-            })
-            scanner = FileScanner(tmp)
-            files = await scanner.scan()
-            paths = {f.path for f in files}
-            assert "app.py" in paths
-            assert "index.js" in paths
-
-    async def test_ignores_unsupported_extensions(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            _create_tree(tmp, {"photo.png": "binary", "data.bin": "binary"})
-            scanner = FileScanner(tmp)
-            files = await scanner.scan()
-            assert len(files) == 0
-
-    async def test_ignores_configured_directories(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            _create_tree(tmp, {
-                "src": {"main.py": "pass\n"},
-                "node_modules": {"dep.js": "module.exports = {};\n"},
-                "__pycache__": {"cached.py": "cached\n"},
-            })
-            scanner = FileScanner(tmp)
-            files = await scanner.scan()
-            paths = {f.path for f in files}
-            assert any("main.py" in p for p in paths)
-            assert not any("node_modules" in p for p in paths)
-            assert not any("__pycache__" in p for p in paths)
-
-    async def test_detects_language_correctly(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            _create_tree(tmp, {
-                "app.ts": "const x: number = 1;\n",
-                "Main.java": "class Main {}\n",
-                "lib.rs": "fn main() {}\n",
-            })
-            scanner = FileScanner(tmp)
-            files = await scanner.scan()
-            lang_map = {f.path: f.language for f in files}
-            assert lang_map["app.ts"] == "typescript"
-            assert lang_map["Main.java"] == "java"
-            assert lang_map["lib.rs"] == "rust"
-
-    async def test_counts_lines_correctly(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            _create_tree(tmp, {"three_lines.py": "a\nb\nc\n"})
-            scanner = FileScanner(tmp)
-            files = await scanner.scan()
-            assert files[0].line_count == 3
-
-    async def test_skips_oversized_files(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            _create_tree(tmp, {"big.py": "x" * 200})
-            scanner = FileScanner(tmp, max_file_bytes=100)
-            files = await scanner.scan()
-            assert len(files) == 0
-
-    async def test_handles_empty_directory(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            scanner = FileScanner(tmp)
-            files = await scanner.scan()
-            assert files == []
-
-    async def test_uses_relative_paths(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            _create_tree(tmp, {"sub": {"deep.py": "pass\n"}})
-            scanner = FileScanner(tmp)
-            files = await scanner.scan()
-            assert files[0].path == os.path.join("sub", "deep.py")
-
-    async def test_skips_binary_files_gracefully(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            bad_path = os.path.join(tmp, "bad.py")
-            with open(bad_path, "wb") as fh:
-                fh.write(b"\x80\x81\x82\x83")
-            scanner = FileScanner(tmp)
-            files = await scanner.scan()
-            assert len(files) == 0
+    def test_scans_supported_files(self, shared_scan: dict[str, ScannedFile]) -> None:
+        assert "app.py" in shared_scan
+        assert "index.js" in shared_scan
+
+    def test_ignores_unsupported_extensions(self, shared_scan: dict[str, ScannedFile]) -> None:
+        assert "photo.png" not in shared_scan
+        assert "data.bin" not in shared_scan
+
+    def test_ignores_configured_directories(self, shared_scan: dict[str, ScannedFile]) -> None:
+        assert os.path.join("src", "main.py") in shared_scan
+        assert not any("node_modules" in p for p in shared_scan)
+        assert not any("__pycache__" in p for p in shared_scan)
+
+    def test_detects_language_correctly(self, shared_scan: dict[str, ScannedFile]) -> None:
+        assert shared_scan["app.ts"].language == "typescript"
+        assert shared_scan["Main.java"].language == "java"
+        assert shared_scan["lib.rs"].language == "rust"
+
+    def test_counts_lines_correctly(self, shared_scan: dict[str, ScannedFile]) -> None:
+        assert shared_scan["three_lines.py"].line_count == 3
+
+    def test_uses_relative_paths(self, shared_scan: dict[str, ScannedFile]) -> None:
+        assert os.path.join("sub", "deep.py") in shared_scan
+
+    def test_skips_binary_files_gracefully(self, shared_scan: dict[str, ScannedFile]) -> None:
+        assert "bad.py" not in shared_scan
+
+    async def test_skips_oversized_files(self, shared_tree: str) -> None:
+        scanner = FileScanner(shared_tree, max_file_bytes=100)
+        paths = {f.path for f in await scanner.scan()}
+        assert "big.py" not in paths
+        assert "app.py" in paths
+
+    async def test_handles_empty_directory(self, tmp_path: Path) -> None:
+        scanner = FileScanner(str(tmp_path))
+        files = await scanner.scan()
+        assert files == []
@@ -1,138 +1,106 @@
 """Tests for mcp_factory.services.code_guardian.analyzers.security_patterns."""
 
+import asyncio
+import functools
+
 import pytest
 
-from mcp_factory.services.code_guardian.analyzers.security_patterns import SecurityPatternAnalyzer
-from mcp_factory.services.code_guardian.models import ScannedFile
+from mcp_factory.services.code_guardian.analyzers.security_patterns import (
+    _RULE_HINTS,
+    _SECURITY_PATTERNS,
+    SecurityPatternAnalyzer,
+)
+from mcp_factory.services.code_guardian.models import Finding, ScannedFile
+
+pytestmark = pytest.mark.cpu
+
 
+@functools.lru_cache(maxsize=512)
+def _file_tuple(content: str, language: str, path: str) -> tuple[ScannedFile, ...]:
+    """Build the single-file tuple for a snippet, cached per argument set."""
+    return (ScannedFile.from_content(path=path, content=content, language=language),)
 
-def _make_file(
-    content: str, language: str = "python", path: str = "test.py"
-) -> list[ScannedFile]:
+
+def _make_file(content: str, language: str = "python", path: str = "test.py") -> list[ScannedFile]:
     """Wrap content in a single-file list for the analyzer."""
-    return [ScannedFile(path=path, content=content, language=language, line_count=content.count("\n") + 1)]
+    return list(_file_tuple(content, language, path))
+
+
+async def _rules_for(
+    analyzer: SecurityPatternAnalyzer, code: str, **kwargs: str
+) -> tuple[list[Finding], frozenset[str]]:
+    """Analyze *code* and return the findings with the set of rules they hit."""
+    findings = await analyzer.analyze(_make_file(code, **kwargs))
+    return findings, frozenset(f.rule for f in findings)
+
+
+DETECTION_CASES: tuple[tuple[str, str, str, str], ...] = (
+    ('cursor.execute("SELECT * FROM users WHERE id=" + user_id)\n', "sql-injection", "python", "test.py"),
+    ("query = f\"SELECT * FROM users WHERE id={user_id}\"\n", "sql-injection-fstring", "python", "test.py"),
+    ("element.innerHTML = userInput;\n", "xss-innerhtml", "javascript", "app.js"),
+    ('<div dangerouslySetInnerHTML={{__html: content}} />\n', "xss-dangerously-set", "javascript", "component.jsx"),
+    ("document.write(data);\n", "xss-document-write", "javascript", "page.js"),
+    ("result = eval(user_input)\n", "eval-usage", "python", "test.py"),
+    ("import hashlib\nhash_val = hashlib.md5(data)\n", "insecure-hash-md5", "python", "test.py"),
+    ("hash_val = sha1(password)\n", "insecure-hash-sha1", "python", "test.py"),
+    ("data = open('../../../etc/passwd')\n", "path-traversal", "python", "test.py"),
+    ("obj = pickle.load(untrusted_data)\n", "insecure-deserialization", "python", "test.py"),
+    ("const token = Math.random().toString(36);\n", "insecure-random", "javascript", "auth.js"),
+    ('HOST = "192.168.1.100"\n', "hardcoded-ip", "python", "test.py"),
+    ('subprocess.call(cmd, shell=True)\n', "subprocess-shell-true", "python", "test.py"),
+    ('exec(user_code)\n', "exec-usage", "python", "test.py"),
+)
+
+
+@pytest.fixture(scope="module")
+def analyzer() -> SecurityPatternAnalyzer:
+    """Share one stateless analyzer across the module."""
+    return SecurityPatternAnalyzer()
 
 
-@pytest.mark.asyncio
 class TestSecurityPatternAnalyzer:
     """Verify OWASP-style security pattern detection."""
 
-    async def test_name_and_category(self) -> None:
-        analyzer = SecurityPatternAnalyzer()
+    def test_name_and_category(self, analyzer: SecurityPatternAnalyzer) -> None:
         assert analyzer.name == "security-pattern-analyzer"
         assert analyzer.category == "security"
 
-    async def test_detects_sql_injection_format(self) -> None:
-        code = 'cursor.execute("SELECT * FROM users WHERE id=" + user_id)\n'
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "sql-injection" in rules
-
-    async def test_detects_sql_injection_fstring(self) -> None:
-        code = "query = f\"SELECT * FROM users WHERE id={user_id}\"\n"
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "sql-injection-fstring" in rules
-
-    async def test_detects_innerhtml_xss(self) -> None:
-        code = "element.innerHTML = userInput;\n"
-        findings = await SecurityPatternAnalyzer().analyze(
-            _make_file(code, language="javascript", path="app.js")
-        )
-        rules = {f.rule for f in findings}
-        assert "xss-innerhtml" in rules
-
-    async def test_detects_dangerously_set_inner_html(self) -> None:
-        code = '<div dangerouslySetInnerHTML={{__html: content}} />\n'
-        findings = await SecurityPatternAnalyzer().analyze(
-            _make_file(code, language="javascript", path="component.jsx")
+    async def test_detects_all_rules(self, analyzer: SecurityPatternAnalyzer) -> None:
+        results = await asyncio.gather(
+            *(_rules_for(analyzer, code, language=language, path=path) for code, _, language, path in DETECTION_CASES)
         )
-        rules = {f.rule for f in findings}
-        assert "xss-dangerously-set" in rules
+        missing = [
+            expected_rule
+            for (_, expected_rule, _, _), (_, rules) in zip(DETECTION_CASES, results, strict=True)
+            if expected_rule not in rules
+        ]
+        assert missing == []
+
+    def test_every_rule_has_hints(self) -> None:
+        assert set(_RULE_HINTS) == {rule_id for rule_id, *_ in _SECURITY_PATTERNS}
+
+    async def test_hints_match_case_insensitively(self, analyzer: SecurityPatternAnalyzer) -> None:
+        _, rules = await _rules_for(analyzer, 'query = f"Select * FROM users WHERE id={user_id}"\n')
+        assert "sql-injection-fstring" in rules
 
-    async def test_detects_document_write(self) -> None:
-        code = "document.write(data);\n"
-        findings = await SecurityPatternAnalyzer().analyze(
-            _make_file(code, language="javascript", path="page.js")
-        )
-        rules = {f.rule for f in findings}
-        assert "xss-document-write" in rules
-
-    async def test_detects_eval_usage(self) -> None:
-        code = "result = eval(user_input)\n"
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "eval-usage" in rules
-
-    async def test_detects_md5_usage(self) -> None:
-        code = "import hashlib\nhash_val = hashlib.md5(data)\n"
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "insecure-hash-md5" in rules
-
-    async def test_detects_sha1_usage(self) -> None:
-        code = "hash_val = sha1(password)\n"
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "insecure-hash-sha1" in rules
-
-    async def test_detects_path_traversal(self) -> None:
-        code = "data = open('../../../etc/passwd')\n"
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "path-traversal" in rules
-
-    async def test_detects_pickle_deserialization(self) -> None:
-        code = "obj = pickle.load(untrusted_data)\n"
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "insecure-deserialization" in rules
-
-    async def test_detects_insecure_random_js(self) -> None:
-        code = "const token = Math.random().toString(36);\n"
-        findings = await SecurityPatternAnalyzer().analyze(
-            _make_file(code, language="javascript", path="auth.js")
-        )
-        rules = {f.rule for f in findings}
-        assert "insecure-random" in rules
-
-    async def test_detects_hardcoded_ip(self) -> None:
-        code = 'HOST = "192.168.1.100"\n'
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "hardcoded-ip" in rules
-
-    async def test_detects_subprocess_shell_true(self) -> None:
-        code = 'subprocess.call(cmd, shell=True)\n'
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "subprocess-shell-true" in rules
-
-    async def test_detects_exec_usage(self) -> None:
-        code = 'exec(user_code)\n'
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
-        rules = {f.rule for f in findings}
-        assert "exec-usage" in rules
-
-    async def test_language_scoping_ignores_irrelevant(self) -> None:
+    async def test_language_scoping_ignores_irrelevant(self, analyzer: SecurityPatternAnalyzer) -> None:
         code = "result = eval(data)\n"
-        findings = await SecurityPatternAnalyzer().analyze(
+        findings = await analyzer.analyze(
             _make_file(code, language="sql", path="query.sql")
         )
-        eval_findings = [f for f in findings if f.rule == "eval-usage"]
-        assert len(eval_findings) == 0
+        assert not any(f.rule == "eval-usage" for f in findings)
 
-    async def test_clean_code_produces_no_findings(self) -> None:
+    async def test_clean_code_produces_no_findings(self, analyzer: SecurityPatternAnalyzer) -> None:
         code = (
             "def get_user(user_id: int) -> dict:\n"
             "    return db.query(User).filter_by(id=user_id).first()\n"
         )
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
+        findings = await analyzer.analyze(_make_file(code))
         assert len(findings) == 0
 
-    async def test_finding_includes_line_number_and_snippet(self) -> None:
+    async def test_finding_includes_line_number_and_snippet(self, analyzer: SecurityPatternAnalyzer) -> None:
         code = "line1\nresult = eval(user_input)\nline3\n"
-        findings = await SecurityPatternAnalyzer().analyze(_make_file(code))
+        findings = await analyzer.analyze(_make_file(code))
         eval_findings = [f for f in findings if f.rule == "eval-usage"]
         assert eval_findings[0].line_number == 2
         assert eval_findings[0].snippet is not None
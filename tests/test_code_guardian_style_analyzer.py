@@ -5,101 +5,169 @@ import pytest
 from mcp_factory.services.code_guardian.analyzers.style import StyleAnalyzer
 from mcp_factory.services.code_guardian.models import ScannedFile
 
+pytestmark = pytest.mark.cpu
+
 
 def _make_file(content: str, language: str = "python", path: str = "test.py") -> list[ScannedFile]:
     """Wrap content in a single-file list for the analyzer."""
-    return [ScannedFile(path=path, content=content, language=language, line_count=content.count("\n") + 1)]
+    return [ScannedFile.from_content(path=path, content=content, language=language)]
+
+
+@pytest.fixture(scope="module")
+def analyzer() -> StyleAnalyzer:
+    """Share one stateless analyzer across the module."""
+    return StyleAnalyzer()
 
 
-@pytest.mark.asyncio
 class TestStyleAnalyzer:
     """Verify style checks: whitespace, comments, naming."""
 
-    async def test_name_and_category(self) -> None:
-        analyzer = StyleAnalyzer()
+    def test_name_and_category(self, analyzer: StyleAnalyzer) -> None:
         assert analyzer.name == "style-analyzer"
         assert analyzer.category == "style"
 
-    async def test_detects_trailing_whitespace(self) -> None:
+    async def test_detects_trailing_whitespace(self, analyzer: StyleAnalyzer) -> None:
         content = "x = 1   \ny = 2\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         ws_findings = [f for f in findings if f.rule == "trailing-whitespace"]
         assert len(ws_findings) >= 1
         assert ws_findings[0].line_number == 1
 
-    async def test_no_trailing_ws_on_clean_file(self) -> None:
+    async def test_no_trailing_ws_on_clean_file(self, analyzer: StyleAnalyzer) -> None:
         content = "x = 1\ny = 2\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         ws_findings = [f for f in findings if f.rule == "trailing-whitespace"]
         assert len(ws_findings) == 0
 
-    async def test_detects_todo_comment(self) -> None:
+    async def test_trailing_tab_flagged_but_blank_lines_ignored(self, analyzer: StyleAnalyzer) -> None:
+        content = "x = 1\t\n   \n\t\ny = 2\n"
+        findings = await analyzer.analyze(_make_file(content))
+        assert [f.line_number for f in findings if f.rule == "trailing-whitespace"] == [1]
+
+    async def test_detects_todo_comment(self, analyzer: StyleAnalyzer) -> None:
         content = "x = 1  # TODO: fix this\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         todo_findings = [f for f in findings if f.rule == "todo-comment"]
         assert len(todo_findings) >= 1
 
-    async def test_detects_fixme_comment(self) -> None:
+    async def test_detects_fixme_comment(self, analyzer: StyleAnalyzer) -> None:
         content = "x = 1  # FIXME: broken\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         todo_findings = [f for f in findings if f.rule == "todo-comment"]
         assert len(todo_findings) >= 1
 
-    async def test_detects_hack_comment(self) -> None:
+    async def test_detects_hack_comment(self, analyzer: StyleAnalyzer) -> None:
         content = "x = 1  # HACK workaround\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         todo_findings = [f for f in findings if f.rule == "todo-comment"]
         assert len(todo_findings) >= 1
 
-    async def test_detects_mixed_indentation(self) -> None:
+    async def test_todo_markers_match_case_insensitively(self, analyzer: StyleAnalyzer) -> None:
+        content = "# todo: later\n# Hack around it\n# F\u0130XME\nx = 1\n"
+        findings = await analyzer.analyze(_make_file(content))
+        assert [f.line_number for f in findings if f.rule == "todo-comment"] == [1, 2, 3]
+
+    async def test_detects_mixed_indentation(self, analyzer: StyleAnalyzer) -> None:
         content = "def f():\n \tx = 1\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         mixed_findings = [f for f in findings if f.rule == "mixed-indentation"]
         assert len(mixed_findings) >= 1
 
-    async def test_detects_superfluous_comment_python(self) -> None:
+    async def test_detects_superfluous_comment_python(self, analyzer: StyleAnalyzer) -> None:
         content = "# import the module\nimport os\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         sup_findings = [f for f in findings if f.rule == "superfluous-comment"]
         assert len(sup_findings) >= 1
 
-    async def test_detects_superfluous_comment_js(self) -> None:
+    async def test_detects_superfluous_comment_js(self, analyzer: StyleAnalyzer) -> None:
         content = "// import the library\nimport React from 'react';\n"
-        findings = await StyleAnalyzer().analyze(
+        findings = await analyzer.analyze(
             _make_file(content, language="javascript", path="app.js")
         )
         sup_findings = [f for f in findings if f.rule == "superfluous-comment"]
         assert len(sup_findings) >= 1
 
-    async def test_detects_camelcase_function_python(self) -> None:
+    async def test_superfluous_comment_needs_whole_keyword_and_language(self, analyzer: StyleAnalyzer) -> None:
+        python = await analyzer.analyze(_make_file("    # settings below\n# Return early\n"))
+        ruby = await analyzer.analyze(_make_file("# import the gem\n", language="ruby", path="a.rb"))
+        assert [f.line_number for f in python if f.rule == "superfluous-comment"] == [2]
+        assert not any(f.rule == "superfluous-comment" for f in ruby)
+
+    async def test_detects_camelcase_function_python(self, analyzer: StyleAnalyzer) -> None:
         content = "def myFunction():\n    pass\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         naming_findings = [f for f in findings if f.rule == "pep8-naming"]
         assert len(naming_findings) >= 1
         assert "camelCase" in naming_findings[0].message
 
-    async def test_detects_lowercase_class_python(self) -> None:
+    async def test_naming_finding_line_number(self, analyzer: StyleAnalyzer) -> None:
+        content = "import os\n\n\nclass my_class:\n    def myMethod(self): pass\n"
+        findings = await analyzer.analyze(_make_file(content))
+        naming = {(f.line_number, f.snippet) for f in findings if f.rule == "pep8-naming"}
+        assert naming == {(4, "class my_class:"), (5, "def myMethod(self): pass")}
+
+    async def test_detects_lowercase_class_python(self, analyzer: StyleAnalyzer) -> None:
         content = "class my_class:\n    pass\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         naming_findings = [f for f in findings if f.rule == "pep8-naming"]
         assert len(naming_findings) >= 1
         assert "CapitalizedWords" in naming_findings[0].message
 
-    async def test_detects_snake_case_function_js(self) -> None:
+    async def test_naming_findings_follow_line_order(self, analyzer: StyleAnalyzer) -> None:
+        content = "class my_cls:\n    def fooBar(self): pass\nclass ok_x:\n    pass\n"
+        findings = await analyzer.analyze(_make_file(content))
+        assert [f.line_number for f in findings if f.rule == "pep8-naming"] == [1, 2, 3]
+
+    async def test_form_feed_does_not_split_line_numbers(self, analyzer: StyleAnalyzer) -> None:
+        content = "import os\n\x0c\ndef fooBar():\n    pass \n"
+        findings = await analyzer.analyze(_make_file(content))
+        lines = {f.rule: f.line_number for f in findings}
+        assert lines == {"pep8-naming": 3, "trailing-whitespace": 4}
+
+    async def test_crlf_trailing_whitespace(self, analyzer: StyleAnalyzer) -> None:
+        findings = await analyzer.analyze(_make_file("x = 1 \r\ny = 2\r\n"))
+        assert [(f.rule, f.line_number) for f in findings] == [("trailing-whitespace", 1)]
+
+    async def test_ignores_definitions_inside_strings(self, analyzer: StyleAnalyzer) -> None:
+        content = 'EXAMPLE = """\ndef myFunction():\nclass my_class:\n"""\n'
+        findings = await analyzer.analyze(_make_file(content))
+        assert not any(f.rule == "pep8-naming" for f in findings)
+
+    async def test_unparsable_python_falls_back_to_regex(self, analyzer: StyleAnalyzer) -> None:
+        content = "def myFunction(:\n    pass\n"
+        findings = await analyzer.analyze(_make_file(content))
+        assert [f.line_number for f in findings if f.rule == "pep8-naming"] == [1]
+
+    async def test_too_deeply_nested_python_falls_back_to_regex(
+        self, analyzer: StyleAnalyzer
+    ) -> None:
+        content = "def fooBar(): pass\nx = " + " + ".join(['"s"'] * 10_000) + "\n"
+        findings = await analyzer.analyze(_make_file(content))
+        assert [f.line_number for f in findings if f.rule == "pep8-naming"] == [1]
+
+    async def test_detects_snake_case_function_js(self, analyzer: StyleAnalyzer) -> None:
         content = "function my_function() { return 1; }\n"
-        findings = await StyleAnalyzer().analyze(
+        findings = await analyzer.analyze(
             _make_file(content, language="javascript", path="app.js")
         )
         naming_findings = [f for f in findings if f.rule == "js-naming-convention"]
         assert len(naming_findings) >= 1
 
-    async def test_clean_code_no_findings(self) -> None:
+    async def test_clean_code_no_findings(self, analyzer: StyleAnalyzer) -> None:
         content = "def greet(name):\n    return name\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         assert len(findings) == 0
 
-    async def test_todo_finding_includes_snippet(self) -> None:
+    async def test_findings_follow_file_order(self, analyzer: StyleAnalyzer) -> None:
+        files = [
+            ScannedFile(path=f"m{i}.py", content="x = 1 \n", language="python", line_count=2)
+            for i in range(5)
+        ]
+        findings = await analyzer.analyze(files)
+        assert [f.file_path for f in findings] == [f"m{i}.py" for i in range(5)]
+
+    async def test_todo_finding_includes_snippet(self, analyzer: StyleAnalyzer) -> None:
         content = "x = 1  # TODO: refactor later\n"
-        findings = await StyleAnalyzer().analyze(_make_file(content))
+        findings = await analyzer.analyze(_make_file(content))
         todo_findings = [f for f in findings if f.rule == "todo-comment"]
         assert todo_findings[0].snippet is not None
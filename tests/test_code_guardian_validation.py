@@ -1,17 +1,32 @@
 """Tests for mcp_factory.services.code_guardian.validation."""
 
 import os
-import tempfile
+from pathlib import Path
+
+import pytest
 
 from mcp_factory.services.code_guardian.validation import validate_scan_path
 
 
+@pytest.fixture(scope="module")
+def scratch_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One empty directory shared by the module's read-only checks."""
+    return tmp_path_factory.mktemp("scan")
+
+
+@pytest.fixture(scope="module")
+def scratch_file(scratch_dir: Path) -> Path:
+    """One empty regular file inside :func:`scratch_dir`."""
+    path = scratch_dir / "file.txt"
+    path.touch()
+    return path
+
+
 class TestValidateScanPath:
     """Verify path validation logic for scan tool inputs."""
 
-    def test_valid_directory_returns_none(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            assert validate_scan_path(tmp) is None
+    def test_valid_directory_returns_none(self, scratch_dir: Path) -> None:
+        assert validate_scan_path(str(scratch_dir)) is None
 
     def test_empty_string_returns_error(self) -> None:
         result = validate_scan_path("")
@@ -28,11 +43,10 @@ class TestValidateScanPath:
         assert result is not None
         assert "does not exist" in result
 
-    def test_file_path_returns_error(self) -> None:
-        with tempfile.NamedTemporaryFile() as tmp:
-            result = validate_scan_path(tmp.name)
-            assert result is not None
-            assert "not a directory" in result
+    def test_file_path_returns_error(self, scratch_file: Path) -> None:
+        result = validate_scan_path(str(scratch_file))
+        assert result is not None
+        assert "not a directory" in result
 
     def test_tilde_expansion(self) -> None:
         home = os.path.expanduser("~")
@@ -6,6 +6,8 @@ called through the FastMCP interface (with mocked HTTP), and the
 famous-dates resource is accessible.
 """
 
+import json
+
 import httpx
 import pytest
 import respx
@@ -21,19 +23,28 @@ SAMPLE_APOD: dict = {
     "copyright": "Test Photographer",
 }
 
-EXPECTED_TOOL_NAMES: set[str] = {
+_SAMPLE_APOD_BYTES: bytes = json.dumps(SAMPLE_APOD).encode()
+"""``SAMPLE_APOD`` encoded once for the mocked responses."""
+
+_APOD_RESPONSE: httpx.Response = httpx.Response(
+    200, content=_SAMPLE_APOD_BYTES, headers={"content-type": "application/json"}
+)
+"""Canned APOD reply; respx copies a route's ``return_value`` per request."""
+
+EXPECTED_TOOL_NAMES: frozenset[str] = frozenset({
     "get_todays_space_photo",
     "get_space_photo_by_date",
     "get_random_space_photo",
-}
+})
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def mcp_server():
-    """Provide a fresh FastMCP server instance with all plugins applied.
+    """Provide a FastMCP server instance with all plugins applied.
 
-    Builds a new server each time so tests don't share mutable state
-    from the module-level singleton.
+    Built apart from the module-level singleton and shared by every
+    test in this module: the tools open a fresh HTTP client per call
+    and keep no state between calls, so one bootstrap is enough.
     """
     from mcp.server.fastmcp import FastMCP
 
@@ -48,31 +59,34 @@ def mcp_server():
     return server
 
 
+@pytest.fixture()
+def apod_mock(respx_mock: respx.MockRouter) -> respx.Route:
+    """Answer NASA APOD requests with ``SAMPLE_APOD`` for one test."""
+    return respx_mock.get(NASA_APOD_BASE_URL).mock(return_value=_APOD_RESPONSE)
+
+
+@pytest.fixture(scope="module")
+async def tool_names(mcp_server) -> frozenset[str]:
+    """Names of the tools registered on the shared server, listed once."""
+    return frozenset(t.name for t in await mcp_server.list_tools())
+
+
 class TestServerBootstrap:
     """Verify the server boots and all expected tools/resources exist."""
 
-    @pytest.mark.asyncio
-    async def test_all_three_tools_registered(self, mcp_server) -> None:
-        tools = await mcp_server.list_tools()
-        tool_names = {t.name for t in tools}
+    def test_all_three_tools_registered(self, tool_names: frozenset[str]) -> None:
         assert tool_names == EXPECTED_TOOL_NAMES
 
-    @pytest.mark.asyncio
     async def test_famous_dates_resource_registered(self, mcp_server) -> None:
         resources = await mcp_server.list_resources()
         uris = {str(r.uri) for r in resources}
         assert "space://events/famous-dates" in uris
 
 
-@pytest.mark.asyncio
 class TestToolExecution:
     """Call each tool through the FastMCP interface with mocked HTTP."""
 
-    @respx.mock
-    async def test_get_todays_space_photo(self, mcp_server) -> None:
-        respx.get(NASA_APOD_BASE_URL).mock(
-            return_value=httpx.Response(200, json=SAMPLE_APOD)
-        )
+    async def test_get_todays_space_photo(self, mcp_server, apod_mock: respx.Route) -> None:
         result_tuple = await mcp_server.call_tool("get_todays_space_photo", {})
         text = result_tuple[0][0].text
 
@@ -80,12 +94,9 @@ class TestToolExecution:
         assert SAMPLE_APOD["date"] in text
         assert SAMPLE_APOD["url"] in text
         assert "Test Photographer" in text
+        assert apod_mock.called
 
-    @respx.mock
-    async def test_get_space_photo_by_date(self, mcp_server) -> None:
-        respx.get(NASA_APOD_BASE_URL).mock(
-            return_value=httpx.Response(200, json=SAMPLE_APOD)
-        )
+    async def test_get_space_photo_by_date(self, mcp_server, apod_mock: respx.Route) -> None:
         result_tuple = await mcp_server.call_tool(
             "get_space_photo_by_date", {"date": "2024-06-15"}
         )
@@ -94,11 +105,7 @@ class TestToolExecution:
         assert SAMPLE_APOD["title"] in text
         assert SAMPLE_APOD["explanation"] in text
 
-    @respx.mock
-    async def test_get_random_space_photo(self, mcp_server) -> None:
-        respx.get(NASA_APOD_BASE_URL).mock(
-            return_value=httpx.Response(200, json=SAMPLE_APOD)
-        )
+    async def test_get_random_space_photo(self, mcp_server, apod_mock: respx.Route) -> None:
         result_tuple = await mcp_server.call_tool("get_random_space_photo", {})
         text = result_tuple[0][0].text
 
@@ -134,7 +141,6 @@ class TestToolExecution:
 class TestResourceAccess:
     """Verify resources are readable through the FastMCP interface."""
 
-    @pytest.mark.asyncio
     async def test_famous_dates_resource_content(self, mcp_server) -> None:
         result = await mcp_server.read_resource("space://events/famous-dates")
         content = result[0].content
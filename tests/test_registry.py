@@ -1,6 +1,6 @@
 """Tests for mcp_factory.services.registry.ServiceRegistry."""
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -24,7 +24,7 @@ class TestServiceRegistry:
 
     def test_starts_empty(self) -> None:
         registry = ServiceRegistry()
-        assert registry.plugins == []
+        assert registry.plugins == ()
 
     def test_add_stores_plugin(self) -> None:
         registry = ServiceRegistry()
@@ -46,7 +46,7 @@ class TestServiceRegistry:
         registry.add(p1)
         registry.add(p2)
 
-        mock_mcp = MagicMock()
+        mock_mcp = SimpleNamespace()
         registry.apply_all(mock_mcp)
 
         assert p1.registered is True
@@ -67,14 +67,18 @@ class TestServiceRegistry:
 
         registry.add(OrderedPlugin("first"))
         registry.add(OrderedPlugin("second"))
-        registry.apply_all(MagicMock())
+        registry.apply_all(SimpleNamespace())
 
         assert call_order == ["first", "second"]
 
-    def test_plugins_returns_copy(self) -> None:
+    def test_plugins_returns_snapshot(self) -> None:
         registry = ServiceRegistry()
         plugin = _StubPlugin()
         registry.add(plugin)
-        plugins_copy = registry.plugins
-        plugins_copy.clear()
-        assert len(registry.plugins) == 1
+        snapshot = registry.plugins
+        assert isinstance(snapshot, tuple)
+        assert registry.plugins is snapshot
+
+        registry.add(_StubPlugin())
+        assert snapshot == (plugin,)
+        assert len(registry.plugins) == 2